@@ -23,7 +23,7 @@ class BlastRadiusAnalyzer:
         impacted_ids = self.graph.get_impacted_nodes(source_node_ids, max_depth)
 
         # Sort for deterministic output
-        sorted_impacted = sorted(list(impacted_ids))
+        sorted_impacted = sorted(impacted_ids)
 
         return {
             "source_artifacts": source_node_ids,
@@ -2,25 +2,11 @@
 CLI Commands Package.
 
 Each command is implemented in its own module for maintainability.
+Submodules are imported on first attribute access, so importing this
+package does not load every command's dependencies.
 """
 
-from . import (
-    blast_radius,
-    check,
-    diff,
-    explain,
-    feedback,
-    graph,
-    impact,
-    ingest,
-    lint,
-    review,
-    scan,
-    stats,
-    suppress,
-    trace,
-    visualize,
-)
+import importlib
 
 __all__ = [
     "scan",
@@ -39,3 +25,12 @@ __all__ = [
     "visualize",
     "review",
 ]
+
+
+def __getattr__(name: str):
+    """Import a command module on first access (PEP 562)."""
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -21,8 +21,8 @@ from ...cli.formatters.diff import DiffFormatter
 from ...core.graph import DependencyGraph
 from ...core.storage.sqlite import SQLiteStorage
 from ...core.types import Edge, Node
-from ...git.diff_engine import FileStatus, GitDiffEngine, GitError
-from ...parsing.engine import ScanConfig, create_default_engine
+from ...git.diff_engine import ChangedFile, FileStatus, GitDiffEngine, GitError
+from ...parsing.engine import ParserEngine, ScanConfig, create_default_engine
 
 logger = logging.getLogger(__name__)
 console = Console()
@@ -33,7 +33,8 @@ def _build_virtual_base_graph(
     head_graph: DependencyGraph,
     git_engine: GitDiffEngine,
     base_ref: str,
-    head_ref: str,
+    changed_files: list[ChangedFile],
+    parser_engine: ParserEngine,
 ) -> DependencyGraph:
     """
     Constructs the dependency graph for the Base Ref.
@@ -42,12 +43,13 @@ def _build_virtual_base_graph(
     1. For files that HAVEN'T changed, reuse nodes/edges from Head Graph.
     2. For files that HAVE changed (Modified/Deleted), fetch content from git
        at base_ref, parse it, and add those nodes/edges.
+
+    `changed_files` and `parser_engine` are the ones the caller already has,
+    so git is not asked for the diff twice.
     """
     base_graph = DependencyGraph()
-    parser_engine = create_default_engine()
 
-    # 1. Get list of changed files
-    changed_files = git_engine.get_changed_files(base_ref, head_ref)
+    # 1. Paths of the changed files
     changed_paths = {str(f.path).lstrip("./") for f in changed_files}
 
     # 2. Re-use Unchanged Nodes (Optimization)
@@ -170,6 +172,8 @@ def diff(
 
         console.print(f"[dim]Found {len(changed_files)} changed file(s)[/dim]")
 
+        parser_engine = create_default_engine()
+
         # 3. Build HEAD Graph (Current State)
         with console.status("[bold]Scanning HEAD state...[/bold]"):
             db_path = repo_path / ".jnkn" / "jnkn.db"
@@ -182,8 +186,7 @@ def diff(
                 # Build fresh
                 storage = SQLiteStorage(repo_path / ".jnkn" / "diff_temp.db")
                 storage.clear()
-                engine = create_default_engine()
-                result = engine.scan_and_store(
+                result = parser_engine.scan_and_store(
                     storage, ScanConfig(root_dir=repo_path, incremental=False)
                 )
                 head_graph = storage.load_graph()
@@ -191,7 +194,7 @@ def diff(
         # 4. Build BASE Graph (Time Travel)
         # This allows us to see what was REMOVED
         base_graph = _build_virtual_base_graph(
-            repo_path, head_graph, git_engine, base_ref, head_ref
+            repo_path, head_graph, git_engine, base_ref, changed_files, parser_engine
         )
 
         # 5. Analyze Diff
@@ -231,13 +234,15 @@ def diff(
                 "changes": diff_report.to_dict(),
                 "reviewers": [r.to_dict() for r in reviewers],
             }
-            output_content = json.dumps(result, indent=2)
-
+            # json.dump writes encoder chunks as they are produced instead of
+            # building the whole document as one string first
             if output:
-                Path(output).write_text(output_content)
+                with open(output, "w") as f:
+                    json.dump(result, f, indent=2)
                 console.print(f"[green]✓[/green] Written to {output}")
             else:
-                print(output_content)
+                json.dump(result, sys.stdout, indent=2)
+                sys.stdout.write("\n")
 
         elif output_format == "markdown":
             output_content = formatter.generate_markdown(diff_report, risk_assessment, reviewers)
@@ -10,6 +10,9 @@ import click
 
 from ..utils import echo_error, load_graph
 
+# Node ID prefixes that mark a target as a full ID rather than a partial name
+_KNOWN_PREFIXES = frozenset({"data", "file", "job", "env", "infra"})
+
 
 @click.command()
 @click.argument("target")
@@ -67,7 +70,8 @@ def impact(
 def _resolve_target(graph, target: str) -> str | None:
     """Resolve partial target name to full node ID."""
     # If already a full ID, use it
-    if target.startswith(("data:", "file:", "job:", "env:", "infra:")):
+    head, sep, _ = target.partition(":")
+    if sep and head in _KNOWN_PREFIXES:
         if target in graph._nodes:
             return target
         echo_error(f"Node not found: {target}")
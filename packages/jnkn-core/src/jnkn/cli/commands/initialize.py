@@ -9,14 +9,14 @@ Security Note:
     users understand exactly what data remains local vs what is sent.
 """
 
+import os
 import uuid
 from pathlib import Path
-from typing import Set
+from typing import Any, Dict, List, Set
 
 import click
 import yaml
 from rich.console import Console
-from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.prompt import Confirm
 
@@ -24,49 +24,130 @@ from ...core.demo import DemoManager
 from ...core.mode import ModeManager
 from ...core.packs import detect_and_suggest_pack, get_available_packs, load_pack
 
+try:
+    # libyaml's emitter when PyYAML was built with it
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+
 console = Console()
 
-# Default configuration template
-# Configured for "Discovery Mode" by default to show immediate value
-DEFAULT_CONFIG = {
-    "version": "1.0",
-    "project_name": "my-project",
-    "mode": "discovery",  # Start in discovery mode
-    "pack": None,  # Framework pack name
-    "scan": {
-        "include": [],
-        "exclude": [
-            "**/node_modules/**",
-            "**/venv/**",
-            "**/.terraform/**",
-            "**/__pycache__/**",
-            "**/dist/**",
-            "**/build/**",
-        ],
-        "min_confidence": 0.3,  # Lower default for discovery mode
-    },
-    "telemetry": {"enabled": False, "distinct_id": ""},
-}
+
+def _new_config() -> Dict[str, Any]:
+    """
+    Build a fresh default configuration.
+
+    Configured for "Discovery Mode" by default to show immediate value. A
+    literal is cheaper than deep-copying a shared template and cannot leak
+    one project's settings into the next.
+    """
+    return {
+        "version": "1.0",
+        "project_name": "my-project",
+        "mode": "discovery",  # Start in discovery mode
+        "pack": None,  # Framework pack name
+        "scan": {
+            "include": [],
+            "exclude": [
+                "**/node_modules/**",
+                "**/venv/**",
+                "**/.terraform/**",
+                "**/__pycache__/**",
+                "**/dist/**",
+                "**/build/**",
+            ],
+            "min_confidence": 0.3,  # Lower default for discovery mode
+        },
+        "telemetry": {"enabled": False, "distinct_id": ""},
+    }
+
+
+# Default configuration template, for reference; init builds its own copy
+DEFAULT_CONFIG = _new_config()
+
+
+# File extensions that mark a technology somewhere in the tree
+STACK_EXTENSIONS = {"py": "python", "tf": "terraform", "yaml": "kubernetes", "yml": "kubernetes"}
+
+# Directory names never descended into while detecting the stack: the default
+# scan excludes ("**/node_modules/**" -> "node_modules") plus git metadata
+STACK_SKIP_DIRS = frozenset(
+    pattern.strip("*/") for pattern in DEFAULT_CONFIG["scan"]["exclude"]
+) | {".git"}
+
+
+def _scan_stack(root: str, wanted: Set[str]) -> Set[str]:
+    """
+    Walk `root` once and return the technologies in `wanted` found by extension.
+
+    Stops as soon as every wanted technology has been seen.
+    """
+    found: Set[str] = set()
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in STACK_SKIP_DIRS:
+                            stack.append(entry.path)
+                        continue
+                except OSError:
+                    continue
+
+                _, dot, ext = name.rpartition(".")
+                tech = STACK_EXTENSIONS.get(ext) if dot else None
+                if tech in wanted and tech not in found:
+                    found.add(tech)
+                    if found == wanted:
+                        return found
+    return found
 
 
 def detect_stack(root_dir: Path) -> Set[str]:
     """
     Heuristically detect technologies used in the directory.
     """
+    root = os.fspath(root_dir)
     stack = set()
-    if list(root_dir.glob("**/*.py")) or (root_dir / "pyproject.toml").exists():
+    if os.path.isfile(os.path.join(root, "pyproject.toml")):
         stack.add("python")
-    if list(root_dir.glob("**/*.tf")):
-        stack.add("terraform")
-    if list(root_dir.glob("**/*.yaml")) or list(root_dir.glob("**/*.yml")):
-        stack.add("kubernetes")
-    if (root_dir / "dbt_project.yml").exists():
+    if os.path.isfile(os.path.join(root, "dbt_project.yml")):
         stack.add("dbt")
-    if (root_dir / "package.json").exists():
+    if os.path.isfile(os.path.join(root, "package.json")):
         stack.add("javascript")
+
+    # One walk for everything detected by extension, skipping what is known
+    wanted = set(STACK_EXTENSIONS.values()) - stack
+    stack |= _scan_stack(root, wanted)
     return stack
 
 
+# Scan include patterns per detected technology, in config order
+STACK_INCLUDES = {
+    "python": ("**/*.py",),
+    "terraform": ("**/*.tf",),
+    "javascript": ("**/*.js", "**/*.ts", "**/*.tsx"),
+    "kubernetes": ("**/*.yaml", "**/*.yml"),
+}
+
+
+def _include_patterns_for(stack: Set[str]) -> List[str]:
+    """Return the scan include patterns for a detected stack, or everything."""
+    includes = [
+        pattern
+        for tech, patterns in STACK_INCLUDES.items()
+        if tech in stack
+        for pattern in patterns
+    ]
+    return includes or ["**/*"]
+
+
 def create_gitignore(jnkn_dir: Path):
     """Ensure the .jnkn/ directory is ignored by git."""
     gitignore = jnkn_dir.parent / ".gitignore"
@@ -76,15 +157,14 @@ def create_gitignore(jnkn_dir: Path):
         with open(gitignore, "w") as f:
             f.write(entry)
     else:
-        content = gitignore.read_text()
-        if ".jnkn" not in content:
+        # Byte search: no decoding, and no failure on non-UTF-8 ignore files
+        if b".jnkn" not in gitignore.read_bytes():
             with open(gitignore, "a") as f:
                 f.write(entry)
 
 
-def _display_privacy_manifesto():
-    """Display the privacy and telemetry transparency panel."""
-    manifesto = """
+# Shown before asking for telemetry consent
+PRIVACY_MANIFESTO = """
 **Your Code Stays Here.**
 
 Jnkan is built for security-conscious environments. We want to be hyper-transparent about how we handle your data:
@@ -98,10 +178,18 @@ Jnkan is built for security-conscious environments. We want to be hyper-transpar
 * ✅ **System Info:** Python version, OS platform, and CLI version.
 
 *This helps us improve performance and prioritize feature development.*
-    """
+""".strip()
+
+
+def _display_privacy_manifesto():
+    """Display the privacy and telemetry transparency panel."""
+    # Imported here: rich.markdown pulls in markdown-it, which every other
+    # command would otherwise load at startup
+    from rich.markdown import Markdown
+
     console.print(
         Panel(
-            Markdown(manifesto.strip()),
+            Markdown(PRIVACY_MANIFESTO),
             title="🔒 [bold]Security & Privacy[/bold]",
             border_style="green",
             expand=False,
@@ -135,7 +223,7 @@ def _init_project(
             console.print(f"✅ Detected: [cyan]{', '.join(stack)}[/cyan]")
 
     # Config Builder
-    config = DEFAULT_CONFIG.copy()
+    config = _new_config()
     config["project_name"] = root_dir.name
 
     # === Pack Detection/Selection (add after stack detection) ===
@@ -160,18 +248,7 @@ def _init_project(
                 config["pack"] = suggested
                 console.print(f"✅ Pack enabled: [cyan]{suggested}[/cyan]")
 
-    includes = []
-    if "python" in stack:
-        includes.append("**/*.py")
-    if "terraform" in stack:
-        includes.append("**/*.tf")
-    if "javascript" in stack:
-        includes.extend(["**/*.js", "**/*.ts", "**/*.tsx"])
-    if "kubernetes" in stack:
-        includes.extend(["**/*.yaml", "**/*.yml"])
-
-    if not includes:
-        includes = ["**/*"]
+    includes = _include_patterns_for(stack)
 
     config["scan"]["include"] = includes
 
@@ -198,8 +275,13 @@ def _init_project(
 
     # Write Files
     jnkn_dir.mkdir(exist_ok=True)
-    with open(config_file, "w") as f:
-        yaml.dump(config, f, sort_keys=False, default_flow_style=False)
+    # Dumped to bytes in memory and written once, rather than streamed through
+    # a text wrapper in many small writes
+    config_yaml = yaml.dump(
+        config, Dumper=YamlDumper, sort_keys=False, default_flow_style=False, encoding="utf-8"
+    )
+    with open(config_file, "wb") as f:
+        f.write(config_yaml)
 
     create_gitignore(jnkn_dir)
 
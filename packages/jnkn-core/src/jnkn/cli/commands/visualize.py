@@ -14,11 +14,12 @@ from ..utils import echo_error, load_graph
     "-g", "--graph", "graph_file", default=".jnkn/jnkn.db", help="Path to graph JSON file or DB"
 )
 @click.option("-o", "--output", default="graph.html", help="Output HTML file path")
-def visualize(graph_file: str, output: str) -> None:
+@click.option("--no-open", is_flag=True, help="Write the file without opening a browser")
+def visualize(graph_file: str, output: str, no_open: bool) -> None:
     """
     Generate an interactive HTML visualization of the graph.
 
-    Opens the result in your default browser.
+    Opens the result in your default browser unless --no-open is given.
     """
     graph = load_graph(graph_file)
 
@@ -32,8 +33,9 @@ def visualize(graph_file: str, output: str) -> None:
     click.echo(f"🎨 Generating visualization for {graph.node_count} nodes...")
 
     try:
-        path = open_visualization(graph, output)
+        path = open_visualization(graph, output, open_browser=not no_open)
         click.echo(f"✅ Visualization saved to: {path}")
-        click.echo("   Opening in browser...")
+        if not no_open:
+            click.echo("   Opening in browser...")
     except Exception as e:
         echo_error(f"Failed to generate visualization: {e}")
@@ -25,20 +25,24 @@ DOMAIN_STYLES = {
 }
 
 
+# ID prefixes (text before the first ":") that map directly to a display domain
+PREFIX_DOMAINS = {
+    "env": "config",
+    "infra": "terraform",
+    "k8s": "kubernetes",
+    "data": "data",
+}
+
+
 def _get_domain(artifact_id: str) -> str:
     """
     Determine the display domain for an artifact ID.
     """
-    if artifact_id.startswith("env:"):
-        return "config"
-    if artifact_id.startswith("infra:"):
-        return "terraform"
-    if artifact_id.startswith("k8s:"):
-        return "kubernetes"
-    if artifact_id.startswith("data:"):
-        return "data"
-
-    if artifact_id.startswith("file://"):
+    prefix, sep, rest = artifact_id.partition(":")
+    if sep and prefix in PREFIX_DOMAINS:
+        return PREFIX_DOMAINS[prefix]
+
+    if prefix == "file" and rest.startswith("//"):
         path = artifact_id.replace("file://", "")
         ext = Path(path).suffix.lower()
         if ext in (".py", ".pyi"):
@@ -7,38 +7,72 @@ focused for the 0.0.1 launch, while still allowing integration tests
 and power users to access them.
 """
 
+import importlib
+
 import click
 
-from .commands import (
-    action,
-    blast_radius,
-    cache,
-    check,
-    deps,
-    diff,
-    explain,
-    feedback,
-    graph,
-    impact,
-    ingest,
-    install,
-    lint,
-    lock,
-    mappings,
-    review,
-    scan,
-    stats,
-    suppress,
-    trace,
-    visualize,
-    watch,
-)
+from .commands import check, feedback, watch
 from .commands.initialize import init
 from .utils_telemetry import TelemetryGroup
 
+# =============================================================================
+# ZONE B: Hidden / Advanced (Fully Functional)
+# These commands work (and are tested) but are hidden from the CLI help
+# to reduce cognitive load during onboarding. Since `jnkn --help` never lists
+# them, their modules are only imported once the command is actually invoked.
+# Format: command name -> (module in jnkn.cli.commands, attribute)
+# =============================================================================
+
+HIDDEN_COMMANDS = {
+    # 1. Core Logic (Used by check/tests)
+    "scan": ("scan", "scan"),
+    "blast": ("blast_radius", "blast_radius"),
+    # 2. CI/CD Internals
+    "action": ("action", "action"),
+    # 3. Debugging & Visualization
+    "graph": ("graph", "graph"),
+    "visualize": ("visualize", "visualize"),
+    "trace": ("trace", "trace"),
+    "impact": ("impact", "impact"),
+    "explain": ("explain", "explain"),
+    # 4. Maintenance & Tuning
+    "stats": ("stats", "stats"),
+    "clear": ("stats", "clear"),
+    "suppress": ("suppress", "suppress"),
+    "review": ("review", "review"),
+    "lint": ("lint", "lint"),
+    "diff": ("diff", "diff"),
+    "ingest": ("ingest", "ingest"),
+    "lock": ("lock", "lock"),
+    "install": ("install", "install"),
+    "cache": ("cache", "cache"),
+    "mappings": ("mappings", "mappings"),
+    "deps": ("deps", "deps"),
+}
+
+
+class JnknGroup(TelemetryGroup):
+    """
+    Top-level command group that registers hidden commands on first lookup.
+
+    Hidden commands are omitted from `list_commands` until loaded; Click
+    filters hidden commands out of help and shell completion anyway.
+    """
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Return a registered command, importing a hidden one on demand."""
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in HIDDEN_COMMANDS:
+            module_name, attr = HIDDEN_COMMANDS[cmd_name]
+            module = importlib.import_module(f".commands.{module_name}", __package__)
+            command = getattr(module, attr)
+            command.hidden = True
+            self.add_command(command, name=cmd_name)
+        return command
 
-# Use cls=TelemetryGroup to enable automatic tracking
-@click.group(cls=TelemetryGroup)
+
+# Use cls=JnknGroup (a TelemetryGroup) to enable automatic tracking
+@click.group(cls=JnknGroup)
 @click.version_option(package_name="jnkn")
 def main():
     """jnkn: The Pre-Flight Impact Analysis Engine.
@@ -59,76 +93,5 @@ main.add_command(check.check)
 main.add_command(watch.watch)
 main.add_command(feedback.feedback)
 
-
-# =============================================================================
-# ZONE B: Hidden / Advanced (Fully Functional)
-# These commands work (and are tested) but are hidden from the CLI help
-# to reduce cognitive load during onboarding.
-# =============================================================================
-
-# 1. Core Logic (Used by check/tests)
-scan.scan.hidden = True
-main.add_command(scan.scan)
-
-blast_radius.blast_radius.hidden = True
-main.add_command(blast_radius.blast_radius, name="blast")
-
-# 2. CI/CD Internals
-action.action.hidden = True
-main.add_command(action.action)
-
-# 3. Debugging & Visualization
-graph.graph.hidden = True
-main.add_command(graph.graph)
-
-visualize.visualize.hidden = True
-main.add_command(visualize.visualize)
-
-trace.trace.hidden = True
-main.add_command(trace.trace)
-
-impact.impact.hidden = True
-main.add_command(impact.impact)
-
-explain.explain.hidden = True
-main.add_command(explain.explain)
-
-# 4. Maintenance & Tuning
-stats.stats.hidden = True
-main.add_command(stats.stats)
-
-stats.clear.hidden = True
-main.add_command(stats.clear)
-
-suppress.suppress.hidden = True
-main.add_command(suppress.suppress)
-
-review.review.hidden = True
-main.add_command(review.review)
-
-lint.lint.hidden = True
-main.add_command(lint.lint)
-
-diff.diff.hidden = True
-main.add_command(diff.diff)
-
-ingest.ingest.hidden = True
-main.add_command(ingest.ingest)
-
-lock.lock.hidden = True
-main.add_command(lock.lock)
-
-install.install.hidden = True
-main.add_command(install.install)
-
-cache.cache.hidden = True
-main.add_command(cache.cache)
-
-mappings.mappings.hidden = True
-main.add_command(mappings.mappings)
-
-deps.deps.hidden = True
-main.add_command(deps.deps)
-
 if __name__ == "__main__":
     main()
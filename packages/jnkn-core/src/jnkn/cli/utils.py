@@ -5,12 +5,16 @@ This module provides common functionality used across various CLI commands,
 including formatted printing, graph loading logic, and user guidance helpers.
 """
 
+import hashlib
 import json
+import os
+import pickle
 from pathlib import Path
 from typing import TYPE_CHECKING, Set, Union
 
 import click
 
+from jnkn import __version__
 from jnkn.core.graph import DependencyGraph
 
 from ..core.storage.sqlite import SQLiteStorage
@@ -39,6 +43,17 @@ SKIP_DIRS: Set[str] = {
     "*.egg-info",
 }
 
+# Deserialized JSON graphs from previous `load_graph` calls (kept apart from
+# ~/.jnkn/cache, whose entries are git dependencies)
+GRAPH_CACHE_DIR = Path.home() / ".jnkn" / "graph-cache"
+
+# Most recently written entries kept; older ones are deleted on each write
+GRAPH_CACHE_MAX_ENTRIES = 16
+
+# Part of every cache key. Bump when LineageGraph's pickled layout changes:
+# editable installs keep the same __version__ across such changes.
+GRAPH_CACHE_FORMAT = 1
+
 
 def echo_success(message: str) -> None:
     """
@@ -144,12 +159,57 @@ def load_graph(graph_file: str) -> Union[DependencyGraph, LineageGraph] | None:
 
     elif target_file.suffix == ".json":
         try:
-            data = json.loads(target_file.read_text())
-            graph = LineageGraph()
-            graph.load_from_dict(data)
-            return graph
+            return _load_json_graph(target_file)
         except Exception as e:
             echo_error(f"Failed to load JSON: {e}")
             return None
 
     return None
+
+
+def _load_json_graph(target_file: Path) -> LineageGraph:
+    """
+    Load a JSON graph, reusing the graph pickled by an earlier load if the file is unchanged.
+
+    Entries are keyed by the file's resolved path, mtime and size (plus the jnkn
+    version and `GRAPH_CACHE_FORMAT`) and live under the user's home, like the
+    git dependency cache, so a checked-out repository can never supply a pickle
+    that gets loaded. At most `GRAPH_CACHE_MAX_ENTRIES` entries are kept. Caching
+    is best-effort: any cache failure falls back to parsing the JSON.
+    """
+    stat = target_file.stat()
+    path_key = hashlib.sha256(str(target_file.resolve()).encode()).hexdigest()[:16]
+    cache_file = (
+        GRAPH_CACHE_DIR
+        / f"{path_key}-{stat.st_mtime_ns}-{stat.st_size}-{__version__}-{GRAPH_CACHE_FORMAT}.pkl"
+    )
+
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        # Missing, truncated, or written by an incompatible version
+        pass
+
+    data = json.loads(target_file.read_bytes())
+    graph = LineageGraph()
+    graph.load_from_dict(data)
+
+    tmp_file = cache_file.with_suffix(".tmp")
+    try:
+        GRAPH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Entries for older versions of this file are never read again
+        for stale in GRAPH_CACHE_DIR.glob(f"{path_key}-*.pkl"):
+            stale.unlink(missing_ok=True)
+        with open(tmp_file, "wb") as f:
+            pickle.dump(graph, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+
+        # Cap the cache, dropping the least recently written graphs first
+        entries = sorted(GRAPH_CACHE_DIR.glob("*.pkl"), key=lambda p: p.stat().st_mtime_ns)
+        for old in entries[:-GRAPH_CACHE_MAX_ENTRIES]:
+            old.unlink(missing_ok=True)
+    except Exception:
+        tmp_file.unlink(missing_ok=True)
+
+    return graph
@@ -105,6 +105,23 @@ class ParsingEventHandler(FileSystemEventHandler):
         if self._should_skip(rel_path):
             return
 
+        # Calculate hash for storage consistency
+        from jnkn.core.types import ScanMetadata
+
+        try:
+            file_hash = ScanMetadata.compute_hash(str(file_path))
+        except Exception:
+            file_hash = ""
+
+        # Editors and tools often fire modify events without changing the content
+        # (atomic saves, touch, checking out the same blob). Skip the parse,
+        # store and stitch cycle when the content matches the last scan.
+        if file_hash:
+            existing_meta = self.storage.get_scan_metadata(str(file_path))
+            if existing_meta and existing_meta.file_hash == file_hash:
+                logger.debug(f"Unchanged content, skipping: {rel_path}")
+                return
+
         logger.info(f"⚡ Change detected: {rel_path}")
 
         # We can't use the full engine.scan_and_store because it scans EVERYTHING.
@@ -115,14 +132,6 @@ class ParsingEventHandler(FileSystemEventHandler):
         # but ideally ParserEngine should expose `process_single_file`.
         # Assuming we added `parse_file_full` to ParserEngine public API as per previous dumps.
 
-        # Calculate hash for storage consistency
-        from jnkn.core.types import ScanMetadata
-
-        try:
-            file_hash = ScanMetadata.compute_hash(str(file_path))
-        except Exception:
-            file_hash = ""
-
         # Use the engine to find the right parser
         result = self.engine._parse_file_full(file_path, file_hash)
 
@@ -4,7 +4,7 @@ Graph Implementation backed by rustworkx.
 
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterator, List, Set
+from typing import Any, Dict, Iterable, Iterator, List, Set
 
 import rustworkx as rx
 
@@ -73,6 +73,52 @@ class DependencyGraph(IGraph):
             self._idx_to_node[idx] = node
             self.token_index.index_node(node)
 
+    def add_nodes(self, nodes: Iterable[Node]) -> None:
+        """
+        Add many nodes at once; same result as calling `add_node` for each.
+
+        Lookups are bound once for the whole batch. Nodes whose ID is already
+        in the graph go through `add_node` as updates.
+        """
+        id_to_idx = self._id_to_idx
+        idx_to_node = self._idx_to_node
+        graph_add = self._graph.add_node
+        index_node = self.token_index.index_node
+        for node in nodes:
+            node_id = node.id
+            if node_id in id_to_idx:
+                self.add_node(node)
+                continue
+            idx = graph_add(node)
+            id_to_idx[node_id] = idx
+            idx_to_node[idx] = node
+            if node.tokens:
+                index_node(node)
+
+    def add_edges(self, edges: Iterable[Edge]) -> None:
+        """
+        Add many edges at once; same result as calling `add_edge` for each.
+
+        Lookups are bound once for the whole batch, and existing edge data is
+        only fetched for index pairs that already have an edge.
+        """
+        id_to_get = self._id_to_idx.get
+        graph = self._graph
+        has_edge = graph.has_edge
+        add = graph.add_edge
+        for edge in edges:
+            src_idx = id_to_get(edge.source_id)
+            tgt_idx = id_to_get(edge.target_id)
+            if src_idx is None or tgt_idx is None:
+                continue
+
+            # Avoid duplicate edges of same type
+            if has_edge(src_idx, tgt_idx):
+                edge_type = edge.type
+                if any(e.type == edge_type for e in graph.get_all_edge_data(src_idx, tgt_idx)):
+                    continue
+            add(src_idx, tgt_idx, edge)
+
     def add_edge(self, edge: Edge) -> None:
         if edge.source_id not in self._id_to_idx or edge.target_id not in self._id_to_idx:
             return
@@ -224,6 +270,10 @@ class DependencyGraph(IGraph):
         current_level = queue
         depth = 0
 
+        # Once every node has been visited no level can discover more, so the
+        # traversal stops instead of expanding the final frontier
+        unvisited = self.node_count - sum(1 for s in visited if s in self._id_to_idx)
+
         while current_level:
             if max_depth != -1 and depth >= max_depth:
                 break
@@ -252,6 +302,10 @@ class DependencyGraph(IGraph):
                             impacted.add(neighbor)
                             next_level.append(neighbor)
 
+            unvisited -= len(next_level)
+            if unvisited == 0:
+                break
+
             current_level = next_level
             depth += 1
 
@@ -115,10 +115,8 @@ class MemoryStorage(StorageAdapter):
     def load_graph(self) -> DependencyGraph:
         """Hydrate a DependencyGraph."""
         graph = DependencyGraph()
-        for node in self._nodes.values():
-            graph.add_node(node)
-        for edge in self._edges.values():
-            graph.add_edge(edge)
+        graph.add_nodes(self._nodes.values())
+        graph.add_edges(self._edges.values())
         return graph
 
     def query_descendants(self, node_id: str, max_depth: int = -1) -> List[str]:
@@ -450,14 +450,10 @@ class SQLiteStorage(StorageAdapter):
         graph = DependencyGraph()
 
         # Load nodes
-        all_nodes = self.load_all_nodes()
-        for node in all_nodes:
-            graph.add_node(node)
+        graph.add_nodes(self.load_all_nodes())
 
         # Load edges
-        all_edges = self.load_all_edges()
-        for edge in all_edges:
-            graph.add_edge(edge)
+        graph.add_edges(self.load_all_edges())
 
         return graph
 
@@ -451,7 +451,6 @@ class LineageGraph:
         Args:
             output_path (Path): Destination path for the HTML file.
         """
-        from .visualize import generate_html
+        from .visualizer import generate_html
 
-        html = generate_html(self)
-        output_path.write_text(html)
+        output_path.write_bytes(generate_html(self))
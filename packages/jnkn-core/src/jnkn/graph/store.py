@@ -104,30 +104,37 @@ class GraphStore:
 
     def calculate_blast_radius(self, changed_artifacts: List[str]) -> Dict[str, Any]:
         """Core Impact Analysis Logic using Rustworkx."""
-        unique_downstream = set()
+        impacted_indices = set()
 
         for root in changed_artifacts:
             if root in self._id_to_idx:
                 root_idx = self._id_to_idx[root]
-                # Rustworkx descendants returns indices
-                descendant_indices = rx.descendants(self.graph, root_idx)
-                unique_downstream.update(self._idx_to_id[i] for i in descendant_indices)
+                # Rustworkx descendants returns indices; union them as ints and
+                # map each distinct index to its ID once
+                impacted_indices.update(rx.descendants(self.graph, root_idx))
+
+        unique_downstream = {self._idx_to_id[i] for i in impacted_indices}
 
         # Categorize results
         breakdown = {"infra": [], "data": [], "code": [], "unknown": []}
+        # Bound once for the per-artifact loop
+        add_infra = breakdown["infra"].append
+        add_data = breakdown["data"].append
+        add_code = breakdown["code"].append
+        add_unknown = breakdown["unknown"].append
         for art in unique_downstream:
-            if any(x in art for x in ["aws_", "google_", "azure_", "k8s", "infra:"]):
-                breakdown["infra"].append(art)
-            elif any(x in art for x in ["table", "model", "view", "data:"]):
-                breakdown["data"].append(art)
+            if any(x in art for x in ("aws_", "google_", "azure_", "k8s", "infra:")):
+                add_infra(art)
+            elif any(x in art for x in ("table", "model", "view", "data:")):
+                add_data(art)
             elif art.endswith((".py", ".ts", ".js", ".go")) or "file:" in art:
-                breakdown["code"].append(art)
+                add_code(art)
             else:
-                breakdown["unknown"].append(art)
+                add_unknown(art)
 
         return {
             "source_artifacts": changed_artifacts,
             "total_impacted_count": len(unique_downstream),
-            "impacted_artifacts": sorted(list(unique_downstream)),
+            "impacted_artifacts": sorted(unique_downstream),
             "breakdown": breakdown,
         }
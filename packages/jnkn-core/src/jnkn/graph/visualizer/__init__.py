@@ -4,49 +4,237 @@ Jnkn Visualization Engine.
 Public API for generating the interactive dependency graph.
 """
 
+import base64
+import hashlib
+import io
 import json
-import webbrowser
+import os
+import threading
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from ...core.interfaces import IGraph
-from .builder import build_html
+from .builder import build_html, build_html_gz
+
+# Rendered documents keyed by (payload digest, compressed). Repeated renders of an
+# unchanged graph skip document assembly entirely. Evicted FIFO.
+_HTML_CACHE: dict[tuple[bytes, bool], bytes] = {}
+_HTML_CACHE_SIZE = 16
+
+
+def _dump_model(obj: BaseModel) -> Any:
+    # Models are dumped lazily, as the encoder reaches them, rather than up front.
+    return obj.model_dump()
+
+
+def _isoformat(obj: date) -> str:
+    # orjson encodes datetime/date natively, so this only fires on the stdlib path.
+    return obj.isoformat()
+
+
+# Exact-type dispatch for _json_default; subclasses are resolved once via
+# isinstance and then memoized here.
+_DEFAULT_DISPATCH: dict[type, Callable[[Any], Any]] = {
+    datetime: _isoformat,
+    date: _isoformat,
+}
+_DEFAULT_BASES: tuple[tuple[type, Callable[[Any], Any]], ...] = (
+    (BaseModel, _dump_model),
+    (date, _isoformat),
+)
 
 
 def _json_default(obj: Any) -> Any:
     """JSON serializer for objects not serializable by default json code."""
-    if isinstance(obj, (datetime, date)):
-        return obj.isoformat()
-    raise TypeError(f"Type {type(obj)} not serializable")
+    handler = _DEFAULT_DISPATCH.get(type(obj))
+    if handler is None:
+        for base, candidate in _DEFAULT_BASES:
+            if isinstance(obj, base):
+                handler = _DEFAULT_DISPATCH[type(obj)] = candidate
+                break
+        else:
+            raise TypeError(f"Type {type(obj)} not serializable")
+    return handler(obj)
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize graph data to UTF-8 JSON bytes, preferring orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=_json_default).encode("utf-8")
 
 
-def generate_html(graph: IGraph) -> str:
+def _emit_items(buf: io.BytesIO, items: Iterable[Any]) -> None:
     """
-    Generate the self-contained HTML content for the graph visualization.
+    Write ``items`` as comma-separated JSON array elements.
+
+    Each model is dumped and encoded straight into ``buf`` as it is reached, so
+    no intermediate list of models or dicts is ever built.
+    """
+    first = True
+    for item in items:
+        if not first:
+            buf.write(b",")
+        buf.write(_dumps(item))
+        first = False
+
+
+def _graph_json(graph: IGraph) -> memoryview:
+    """
+    Serialize the graph's nodes and edges for embedding in the page.
+
+    IGraph implementations are streamed straight from their iterators, one model
+    at a time; objects that only offer ``to_dict`` (e.g. LineageGraph) are
+    encoded in one shot.
     """
-    if hasattr(graph, "to_dict"):
-        graph_data = graph.to_dict()
+    buf = io.BytesIO()
+    if hasattr(graph, "iter_nodes"):
+        buf.write(b'{"nodes":[')
+        _emit_items(buf, graph.iter_nodes())
+        buf.write(b'],"edges":[')
+        _emit_items(buf, graph.iter_edges())
+        buf.write(b"]}")
     else:
-        graph_data = {
-            "nodes": [n.model_dump() for n in graph.iter_nodes()],
-            "edges": [e.model_dump() for e in graph.iter_edges()],
-        }
+        buf.write(_dumps(graph.to_dict()))
 
-    # Serialize data once
-    json_data = json.dumps(graph_data, default=_json_default)
-    return build_html(json_data)
+    return buf.getbuffer()
 
 
-def open_visualization(graph: IGraph, output_path: str = "graph.html") -> str:
+def _encode_varint(buf: bytearray, value: int) -> None:
+    """Append ``value`` to ``buf`` as an unsigned LEB128 varint."""
+    while value > 0x7F:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def _graph_binary(graph: IGraph) -> bytes:
     """
-    Generate and open the visualization in the browser.
+    Serialize the graph with edge endpoints packed as varint node indices.
+
+    Nodes are sorted by ID and emitted as JSON; edges are sorted by endpoint and
+    emitted without ``source_id``/``target_id``, which instead travel in the
+    ``endpoints`` field as a base64 stream of delta-encoded source indices and
+    target indices. Endpoints without a node are appended to ``extra_ids``.
     """
-    html_content = generate_html(graph)
-    out_file = Path(output_path)
-    out_file.write_text(html_content, encoding="utf-8")
+    nodes = sorted(graph.iter_nodes(), key=lambda n: n.id)
+    index = {n.id: i for i, n in enumerate(nodes)}
+    extra_ids: list[str] = []
+
+    def _index(node_id: str) -> int:
+        i = index.get(node_id)
+        if i is None:
+            i = index[node_id] = len(index)
+            extra_ids.append(node_id)
+        return i
+
+    edges = sorted(
+        ((_index(e.source_id), _index(e.target_id), e) for e in graph.iter_edges()),
+        key=lambda item: item[:2],
+    )
 
-    abs_path = out_file.resolve().as_uri()
-    webbrowser.open(abs_path)
+    endpoints = bytearray()
+    previous = 0
+    for source, target, _ in edges:
+        _encode_varint(endpoints, source - previous)
+        _encode_varint(endpoints, target)
+        previous = source
+
+    buf = io.BytesIO()
+    buf.write(b'{"nodes":[')
+    _emit_items(buf, nodes)
+    buf.write(b'],"edges":[')
+    _emit_items(buf, (e.model_dump(exclude={"source_id", "target_id"}) for _, _, e in edges))
+    buf.write(b'],"extra_ids":')
+    buf.write(_dumps(extra_ids))
+    buf.write(b',"endpoints":"')
+    buf.write(base64.b64encode(endpoints))
+    buf.write(b'"}')
+
+    return buf.getvalue()
+
+
+def generate_html(graph: IGraph, compress: bool = False, binary: bool = False) -> bytes:
+    """
+    Generate the self-contained HTML document (UTF-8 bytes) for the graph visualization.
+
+    When ``compress`` is set, the result is a gzip stream suitable for ``.html.gz``
+    files or responses served with ``Content-Encoding: gzip``. ``binary`` packs
+    edge endpoints as varint node indices, shrinking edge-heavy graphs.
+    """
+    # Serialize data once, straight to bytes
+    if binary and hasattr(graph, "iter_nodes"):
+        json_data = _graph_binary(graph)
+    else:
+        json_data = _graph_json(graph)
+    key = (hashlib.blake2b(json_data, digest_size=8).digest(), compress)
+
+    html = _HTML_CACHE.get(key)
+    if html is None:
+        html = build_html_gz(json_data) if compress else build_html(json_data)
+        if len(_HTML_CACHE) >= _HTML_CACHE_SIZE:
+            del _HTML_CACHE[next(iter(_HTML_CACHE))]
+        _HTML_CACHE[key] = html
+    return html
+
+
+def _write_file(path: str, data: bytes) -> None:
+    """Write ``data`` to ``path`` with raw fd writes, bypassing buffered file objects."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            # os.write may write fewer bytes than requested for large payloads.
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _write_and_open(html: bytes, output_path: str, open_browser: bool) -> None:
+    _write_file(output_path, html)
+
+    if open_browser:
+        import webbrowser
+
+        # abspath is pure string work; Path.resolve() would lstat every ancestor.
+        webbrowser.open(Path(os.path.abspath(output_path)).as_uri())
+
+
+def open_visualization(
+    graph: IGraph,
+    output_path: str = "graph.html",
+    gzip_output: bool = False,
+    open_browser: bool = True,
+    background: bool = False,
+) -> str:
+    """
+    Generate the visualization file and optionally open it in the browser.
+
+    Output paths ending in ``.gz`` (or ``gzip_output=True``) are written compressed.
+    With ``background=True`` the file write and browser launch run on a worker
+    thread and the path is returned immediately. The thread is not a daemon, so
+    the interpreter still waits for the write to finish before exiting.
+    """
+    compress = gzip_output or output_path.endswith(".gz")
+    html = generate_html(graph, compress=compress)
+
+    if background:
+        threading.Thread(
+            target=_write_and_open,
+            args=(html, output_path, open_browser),
+            name="jnkn-visualize",
+        ).start()
+    else:
+        _write_and_open(html, output_path, open_browser)
 
-    return str(out_file)
+    return output_path
@@ -12,10 +12,13 @@ Features:
 4. Trace Highlighting for lineage clarity
 """
 
+import gzip
+import re
+
 # =============================================================================
 # CSS ASSETS - "Mission Control" Dark Theme
 # =============================================================================
-CSS_CONTENT = """
+CSS_CONTENT = b"""
 @import url('https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;500;600;700&family=IBM+Plex+Sans:wght@400;500;600;700&display=swap');
 
 :root {
@@ -145,9 +148,9 @@ body {
     background-size: 40px 40px, 40px 40px, 100% 100%;
 }
 
-/* ═══════════════════════════════════════════════════════════════════════════
+/* ===========================================================================
    HEADER
-   ═══════════════════════════════════════════════════════════════════════════ */
+   =========================================================================== */
 
 .header {
     height: var(--header-height);
@@ -319,9 +322,9 @@ body {
 .search-item-name strong { color: var(--status-info); }
 .search-item-type { font-size: var(--text-xs); color: var(--text-tertiary); font-family: var(--font-mono); }
 
-/* ═══════════════════════════════════════════════════════════════════════════
+/* ===========================================================================
    MAIN LAYOUT & COLUMNS
-   ═══════════════════════════════════════════════════════════════════════════ */
+   =========================================================================== */
 
 .main-container { flex: 1; display: flex; overflow: hidden; }
 
@@ -409,9 +412,21 @@ body {
 .column-list::-webkit-scrollbar { width: 6px; }
 .column-list::-webkit-scrollbar-thumb { background: var(--surface-active); border-radius: var(--radius-full); }
 
-/* ═══════════════════════════════════════════════════════════════════════════
+/* Virtualized lists: fixed-height rows absolutely positioned over a spacer */
+.column-list.virtual { position: relative; }
+.virtual-viewport { position: absolute; top: var(--space-2); left: var(--space-2); right: var(--space-2); }
+.virtual-viewport > .item {
+    position: absolute;
+    left: 0;
+    right: 0;
+    height: calc(var(--row-height) - var(--space-1));
+    margin: 0;
+    overflow: hidden;
+}
+
+/* ===========================================================================
    ITEM COMPONENT
-   ═══════════════════════════════════════════════════════════════════════════ */
+   =========================================================================== */
 
 .item {
     display: flex;
@@ -490,9 +505,9 @@ body {
 
 .item:hover .item-chevron { transform: translateX(2px); color: var(--text-tertiary); }
 
-/* ═══════════════════════════════════════════════════════════════════════════
+/* ===========================================================================
    EDGE BADGE - Semantic Connection Visualization ("The Why")
-   ═══════════════════════════════════════════════════════════════════════════ */
+   =========================================================================== */
 
 .edge-info {
     display: flex;
@@ -525,9 +540,9 @@ body {
 .edge-badge--provides { background: var(--domain-config-bg); border-color: rgba(6, 182, 212, 0.25); color: var(--domain-config); }
 .edge-badge--provisions { background: var(--domain-infra-bg); border-color: rgba(249, 115, 22, 0.25); color: var(--domain-infra); }
 
-/* ═══════════════════════════════════════════════════════════════════════════
+/* ===========================================================================
    INDICATORS - Confidence & Risk
-   ═══════════════════════════════════════════════════════════════════════════ */
+   =========================================================================== */
 
 .indicators { display: flex; gap: var(--space-2); margin-top: var(--space-2); flex-wrap: wrap; }
 
@@ -577,9 +592,9 @@ body {
 .risk-indicator--high { background: var(--risk-high-bg); color: var(--risk-high); border: 1px solid rgba(234, 88, 12, 0.3); }
 .risk-indicator--medium { background: var(--risk-medium-bg); color: var(--risk-medium); border: 1px solid rgba(202, 138, 4, 0.3); }
 
-/* ═══════════════════════════════════════════════════════════════════════════
+/* ===========================================================================
    INSPECTOR PANEL - The "So What" Analysis
-   ═══════════════════════════════════════════════════════════════════════════ */
+   =========================================================================== */
 
 .inspector {
     width: var(--inspector-width);
@@ -862,6 +877,10 @@ body {
     font-size: var(--text-xs);
 }
 
+.detail-value.clickable { cursor: pointer; }
+.detail-value.clickable:hover { color: var(--text-primary); }
+.detail-value.expanded { white-space: pre-wrap; }
+
 /* Dependencies Tab */
 .dep-list { display: flex; flex-direction: column; gap: var(--space-2); }
 
@@ -892,9 +911,9 @@ body {
 
 .empty-state-icon { font-size: 32px; margin-bottom: var(--space-3); opacity: 0.5; }
 
-/* ═══════════════════════════════════════════════════════════════════════════
+/* ===========================================================================
    MESH MODAL
-   ═══════════════════════════════════════════════════════════════════════════ */
+   =========================================================================== */
 
 .modal-overlay {
     position: fixed;
@@ -942,15 +961,16 @@ body {
 }
 
 #mesh-container { flex: 1; overflow: hidden; background: var(--void); }
+#mesh-container canvas { display: block; }
 
 .node circle { stroke: var(--surface-0); stroke-width: 2px; cursor: pointer; transition: all var(--duration-fast); }
 .node circle:hover { stroke-width: 3px; filter: drop-shadow(0 0 8px currentColor); }
 .link { stroke: var(--border-default); stroke-opacity: 0.6; }
 .node text { font-size: var(--text-2xs); fill: var(--text-secondary); pointer-events: none; font-family: var(--font-mono); }
 
-/* ═══════════════════════════════════════════════════════════════════════════
+/* ===========================================================================
    ANIMATIONS
-   ═══════════════════════════════════════════════════════════════════════════ */
+   =========================================================================== */
 
 @keyframes fadeIn { from { opacity: 0; } to { opacity: 1; } }
 @keyframes slideDown { from { opacity: 0; transform: translateY(-8px); } to { opacity: 1; transform: translateY(0); } }
@@ -969,15 +989,16 @@ JS_CONTENT = """
 // UTILITIES
 // ═══════════════════════════════════════════════════════════════════════════
 
+const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#039;' };
+const HTML_ESCAPE_RE = /[&<>"']/g;
+const HTML_ESCAPE_TEST = /[&<>"']/;
+
 const Utils = {
+    // One scan with a lookup table; strings with nothing to escape are returned as-is
     escapeHtml(unsafe) {
         if (!unsafe) return '';
-        return String(unsafe)
-            .replace(/&/g, "&amp;")
-            .replace(/</g, "&lt;")
-            .replace(/>/g, "&gt;")
-            .replace(/"/g, "&quot;")
-            .replace(/'/g, "&#039;");
+        const s = String(unsafe);
+        return HTML_ESCAPE_TEST.test(s) ? s.replace(HTML_ESCAPE_RE, c => HTML_ESCAPES[c]) : s;
     },
     
     debounce(fn, delay) {
@@ -1034,15 +1055,215 @@ const Utils = {
     }
 };
 
+// ═══════════════════════════════════════════════════════════════════════════
+// GRAPH KERNELS
+// ═══════════════════════════════════════════════════════════════════════════
+
+// Typed-array graph algorithms shared by the main thread and the graph worker.
+// The worker is built from GraphKernels.toString(), so nothing in here may
+// reference names from outside the function body.
+function GraphKernels() {
+    // Upper bound on the bitset table; larger graphs fall back to per-node BFS
+    const BITSET_BUDGET_BYTES = 128 * 1024 * 1024;
+    
+    function popcount(x) {
+        x = x - ((x >>> 1) & 0x55555555);
+        x = (x & 0x33333333) + ((x >>> 2) & 0x33333333);
+        return Math.imul((x + (x >>> 4)) & 0x0f0f0f0f, 0x01010101) >>> 24;
+    }
+    
+    // Compressed adjacency: targets of v are targets[offsets[v]..offsets[v + 1]), and
+    // edgeIdx[k] is the position in src/dst of the edge that produced targets[k]
+    function buildCsr(n, src, dst) {
+        const offsets = new Int32Array(n + 1);
+        for (let i = 0; i < src.length; i++) offsets[src[i] + 1]++;
+        for (let v = 0; v < n; v++) offsets[v + 1] += offsets[v];
+        const fill = offsets.slice(0, n);
+        const targets = new Int32Array(src.length);
+        const edgeIdx = new Int32Array(src.length);
+        for (let i = 0; i < src.length; i++) {
+            const k = fill[src[i]]++;
+            targets[k] = dst[i];
+            edgeIdx[k] = i;
+        }
+        return { offsets, targets, edgeIdx };
+    }
+    
+    // Iterative Tarjan. Components are numbered in reverse topological order,
+    // so every edge leaving component c points at a component numbered below c.
+    function stronglyConnectedComponents(n, offsets, targets) {
+        const index = new Int32Array(n).fill(-1);
+        const low = new Int32Array(n);
+        const comp = new Int32Array(n).fill(-1);
+        const stack = new Int32Array(n);
+        const callStack = new Int32Array(n);
+        const edgePos = new Int32Array(n);
+        let sp = 0, counter = 0, numComps = 0;
+        
+        for (let root = 0; root < n; root++) {
+            if (index[root] !== -1) continue;
+            let depth = 0;
+            callStack[0] = root;
+            edgePos[0] = offsets[root];
+            index[root] = low[root] = counter++;
+            stack[sp++] = root;
+            
+            while (depth >= 0) {
+                const v = callStack[depth];
+                if (edgePos[depth] < offsets[v + 1]) {
+                    const w = targets[edgePos[depth]++];
+                    if (index[w] === -1) {
+                        index[w] = low[w] = counter++;
+                        stack[sp++] = w;
+                        callStack[++depth] = w;
+                        edgePos[depth] = offsets[w];
+                    } else if (comp[w] === -1 && index[w] < low[v]) {
+                        low[v] = index[w];
+                    }
+                } else {
+                    if (low[v] === index[v]) {
+                        let w;
+                        do { w = stack[--sp]; comp[w] = numComps; } while (w !== v);
+                        numComps++;
+                    }
+                    if (--depth >= 0) {
+                        const u = callStack[depth];
+                        if (low[v] < low[u]) low[u] = low[v];
+                    }
+                }
+            }
+        }
+        return { comp, numComps };
+    }
+    
+    // Single-source BFS over caller-owned scratch buffers of length n. Nodes are marked
+    // on enqueue so the queue never holds more than n entries, and only visited slots
+    // are cleared afterwards.
+    function bfsRadius(offsets, targets, s, queue, visited) {
+        let head = 0, tail = 0;
+        queue[tail++] = s;
+        visited[s] = 1;
+        while (head < tail) {
+            const cur = queue[head++];
+            for (let i = offsets[cur]; i < offsets[cur + 1]; i++) {
+                const t = targets[i];
+                if (!visited[t]) { visited[t] = 1; queue[tail++] = t; }
+            }
+        }
+        for (let i = 0; i < tail; i++) visited[queue[i]] = 0;
+        return tail - 1;
+    }
+    
+    function blastRadiiBfs(n, offsets, targets) {
+        const queue = new Int32Array(n);
+        const visited = new Uint8Array(n);
+        const radii = new Int32Array(n);
+        for (let s = 0; s < n; s++) radii[s] = bfsRadius(offsets, targets, s, queue, visited);
+        return radii;
+    }
+    
+    // Reachability DP over the SCC condensation: each component's reachable set is the
+    // union of its successors' sets plus its own members, kept as a bitset row and
+    // counted with a popcount. Returns the downstream count per node.
+    //
+    // A full table costs O(V^2 / 8) bytes (V^2 / 64 words), so rows are allocated
+    // lazily and released once every predecessor component has merged them; freed
+    // rows are recycled. If the live rows still outgrow BITSET_BUDGET_BYTES the DP
+    // is abandoned for the O(V) memory BFS.
+    function blastRadii(n, offsets, targets) {
+        const { comp, numComps } = stronglyConnectedComponents(n, offsets, targets);
+        const words = (n + 31) >>> 5;
+        const maxRows = Math.floor(BITSET_BUDGET_BYTES / (words * 4));
+        
+        // Bucket nodes by component (counting sort)
+        const start = new Int32Array(numComps + 1);
+        for (let v = 0; v < n; v++) start[comp[v] + 1]++;
+        for (let c = 0; c < numComps; c++) start[c + 1] += start[c];
+        const fill = start.slice(0, numComps);
+        const members = new Int32Array(n);
+        for (let v = 0; v < n; v++) members[fill[comp[v]]++] = v;
+        
+        // Number of distinct predecessor components still waiting to read each row
+        const refs = new Int32Array(numComps);
+        const mergedInto = new Int32Array(numComps).fill(-1);
+        for (let c = 0; c < numComps; c++) {
+            for (let m = start[c]; m < start[c + 1]; m++) {
+                const v = members[m];
+                for (let i = offsets[v]; i < offsets[v + 1]; i++) {
+                    const cw = comp[targets[i]];
+                    if (cw === c || mergedInto[cw] === c) continue;
+                    mergedInto[cw] = c;
+                    refs[cw]++;
+                }
+            }
+        }
+        
+        const rows = new Array(numComps).fill(null);
+        const freeRows = [];
+        const radii = new Int32Array(n);
+        let liveRows = 0;
+        mergedInto.fill(-1);
+        
+        for (let c = 0; c < numComps; c++) {
+            let row = freeRows.pop();
+            if (row) {
+                row.fill(0);
+            } else {
+                if (liveRows >= maxRows) return blastRadiiBfs(n, offsets, targets);
+                row = new Uint32Array(words);
+                liveRows++;
+            }
+            
+            for (let m = start[c]; m < start[c + 1]; m++) {
+                const v = members[m];
+                row[v >>> 5] |= 1 << (v & 31);
+                for (let i = offsets[v]; i < offsets[v + 1]; i++) {
+                    const cw = comp[targets[i]];
+                    if (cw === c || mergedInto[cw] === c) continue;
+                    mergedInto[cw] = c;
+                    const other = rows[cw];
+                    for (let k = 0; k < words; k++) row[k] |= other[k];
+                    if (--refs[cw] === 0) { freeRows.push(other); rows[cw] = null; }
+                }
+            }
+            
+            let count = 0;
+            for (let k = 0; k < words; k++) count += popcount(row[k]);
+            for (let m = start[c]; m < start[c + 1]; m++) radii[members[m]] = count - 1;
+            if (refs[c] === 0) freeRows.push(row);
+            else rows[c] = row;
+        }
+        return radii;
+    }
+    
+    return { popcount, buildCsr, stronglyConnectedComponents, bfsRadius, blastRadiiBfs, blastRadii };
+}
+
+const Kernels = GraphKernels();
+
+const GRAPH_WORKER_SRC = `const Kernels = (${GraphKernels.toString()})();
+self.onmessage = (e) => {
+    const { n, offsets, targets } = e.data;
+    const radii = Kernels.blastRadii(n, offsets, targets);
+    self.postMessage({ radii }, [radii.buffer]);
+};`;
+
 // ═══════════════════════════════════════════════════════════════════════════
 // APPLICATION STATE
 // ═══════════════════════════════════════════════════════════════════════════
 
 const AppState = {
     nodeMap: {},
-    outgoingEdges: {},
-    incomingEdges: {},
+    allNodes: [],
+    domainGroups: {},
+    nodeIdx: {},
+    nodeIds: [],
+    edges: [],
+    outAdj: null,
+    inAdj: null,
     blastRadiusCache: {},
+    blastRadiusReady: false,
+    meshLayoutCache: {},
     mode: 'downstream',
     currentNode: null,
     currentEdge: null,
@@ -1065,34 +1286,169 @@ const AppState = {
 const DataProcessor = {
     indexGraphData(rawData) {
         AppState.nodeMap = {};
-        AppState.outgoingEdges = {};
-        AppState.incomingEdges = {};
+        AppState.meshLayoutCache = {};
+        AppState.blastRadiusCache = {};
+        AppState.blastRadiusReady = false;
         
-        (rawData.nodes || []).forEach(n => AppState.nodeMap[n.id] = n);
-        (rawData.edges || []).forEach(e => {
-            if (!AppState.outgoingEdges[e.source_id]) AppState.outgoingEdges[e.source_id] = [];
-            AppState.outgoingEdges[e.source_id].push(e);
-            if (!AppState.incomingEdges[e.target_id]) AppState.incomingEdges[e.target_id] = [];
-            AppState.incomingEdges[e.target_id].push(e);
+        // Dense integer ids for every node and edge endpoint (dangling endpoints included)
+        const nodeIdx = AppState.nodeIdx = {};
+        const nodeIds = AppState.nodeIds = [];
+        const indexOf = id => {
+            let i = nodeIdx[id];
+            if (i === undefined) { i = nodeIdx[id] = nodeIds.length; nodeIds.push(id); }
+            return i;
+        };
+        
+        const edges = AppState.edges = rawData.edges || [];
+        const src = new Int32Array(edges.length);
+        const dst = new Int32Array(edges.length);
+        const conf = new Float32Array(edges.length);
+        (rawData.nodes || []).forEach(n => { AppState.nodeMap[n.id] = n; indexOf(n.id); });
+        edges.forEach((e, i) => {
+            src[i] = indexOf(e.source_id);
+            dst[i] = indexOf(e.target_id);
+            conf[i] = e.confidence || 1;
+            this.decorateEdge(e, conf[i]);
         });
+        // Adjacency rows are laid out by confidence, highest first, so connection
+        // columns render in that order without sorting on every click
+        const order = new Int32Array(edges.length);
+        for (let i = 0; i < order.length; i++) order[i] = i;
+        order.sort((a, b) => conf[b] - conf[a] || a - b);
+        AppState.outAdj = this.buildAdjacency(nodeIds.length, src, dst, conf, order);
+        AppState.inAdj = this.buildAdjacency(nodeIds.length, dst, src, conf, order);
+        
+        // Render-invariant fields, computed once per index instead of on every row render
+        AppState.allNodes = Object.values(AppState.nodeMap);
+        for (const n of AppState.allNodes) {
+            n._nameLower = (n.name || '').toLowerCase();
+            n._idLower = n.id.toLowerCase();
+            n._icon = Utils.getNodeIcon(n.type, n.id);
+            n._domain = this.getDomainForNode(n);
+            n._idEsc = Utils.escapeHtml(n.id);
+            n._nameEsc = Utils.escapeHtml(n.name);
+            n._typeEsc = Utils.escapeHtml(n.type);
+            n._staticHtml = `<div class="item-icon">${n._icon}</div><div class="item-content"><div class="item-title">${n._nameEsc}</div><div class="item-subtitle">${n._typeEsc}</div>`;
+        }
+        AppState.domainGroups = { 'Infrastructure': [], 'Configuration': [], 'Code': [], 'Data': [] };
+    },
+    
+    // Render-invariant edge fields: confidence level, percentage and badge markup
+    decorateEdge(e, conf) {
+        e._confidence = conf;
+        e._confLevel = Utils.getConfidenceLevel(conf);
+        e._confPct = Utils.formatConfidence(conf);
+        e._badgeHtml = `<span class="confidence-indicator confidence-indicator--${e._confLevel}"><span class="confidence-dot"></span>${e._confPct}%</span>`;
         
-        this.computeBlastRadius();
+        const via = e.metadata?.via || e.metadata?.env_var || e.metadata?.matched_key || '';
+        const et = (e.type || '').toLowerCase();
+        let badgeClass = '';
+        if (et.includes('read')) badgeClass = 'edge-badge--reads';
+        else if (et.includes('provide')) badgeClass = 'edge-badge--provides';
+        else if (et.includes('provision')) badgeClass = 'edge-badge--provisions';
+        const label = Utils.escapeHtml((e.type || 'link').toUpperCase()) + (via ? ` via ${Utils.escapeHtml(via)}` : '');
+        e._edgeInfoHtml = `<div class="edge-info"><span class="edge-badge ${badgeClass}"><span class="edge-badge-icon">${Utils.getEdgeTypeIcon(e.type)}</span><span class="edge-badge-text">${label}</span></span></div>`;
     },
     
-    computeBlastRadius() {
-        Object.keys(AppState.nodeMap).forEach(nodeId => {
-            const visited = new Set();
-            const queue = [nodeId];
-            while (queue.length > 0) {
-                const current = queue.shift();
-                if (visited.has(current)) continue;
-                visited.add(current);
-                (AppState.outgoingEdges[current] || []).forEach(e => {
-                    if (!visited.has(e.target_id)) queue.push(e.target_id);
-                });
+    // CSR adjacency in one direction: the neighbours of node u are
+    // neighbors[offsets[u]..offsets[u + 1]), with the edge index and confidence alongside.
+    // Edges are bucketed in `order`, so each row keeps that relative order.
+    buildAdjacency(n, from, to, edgeConf, order) {
+        const f = new Int32Array(order.length);
+        const t = new Int32Array(order.length);
+        for (let k = 0; k < order.length; k++) { f[k] = from[order[k]]; t[k] = to[order[k]]; }
+        const { offsets, targets, edgeIdx } = Kernels.buildCsr(n, f, t);
+        const conf = new Float32Array(edgeIdx.length);
+        for (let k = 0; k < edgeIdx.length; k++) {
+            edgeIdx[k] = order[edgeIdx[k]];
+            conf[k] = edgeConf[edgeIdx[k]];
+        }
+        return { offsets, neighbors: targets, edgeIdx, conf };
+    },
+    
+    degree(nodeId, adj) {
+        const u = AppState.nodeIdx[nodeId];
+        return u === undefined ? 0 : adj.offsets[u + 1] - adj.offsets[u];
+    },
+    
+    // { node, edge } pairs for the known neighbours of a node along `adj`
+    neighbors(nodeId, adj) {
+        const result = [];
+        const u = AppState.nodeIdx[nodeId];
+        if (u === undefined) return result;
+        for (let k = adj.offsets[u]; k < adj.offsets[u + 1]; k++) {
+            const node = AppState.nodeMap[AppState.nodeIds[adj.neighbors[k]]];
+            if (node) result.push({ node, edge: AppState.edges[adj.edgeIdx[k]] });
+        }
+        return result;
+    },
+    
+    // Blast radius of one node, computed by BFS on first access until the full pass lands
+    getBlastRadius(nodeId) {
+        const cache = AppState.blastRadiusCache;
+        const cached = cache[nodeId];
+        if (cached !== undefined) return cached;
+        const u = AppState.nodeIdx[nodeId];
+        if (u === undefined) return 0;
+        
+        const n = AppState.nodeIds.length;
+        if (!this._bfsQueue || this._bfsQueue.length !== n) {
+            this._bfsQueue = new Int32Array(n);
+            this._bfsVisited = new Uint8Array(n);
+        }
+        const { offsets, neighbors } = AppState.outAdj;
+        return (cache[nodeId] = Kernels.bfsRadius(offsets, neighbors, u, this._bfsQueue, this._bfsVisited));
+    },
+    
+    // Without a worker, fill the cache a slice at a time in idle periods
+    fillBlastRadiusIdle(onProgress, onDone) {
+        const nodes = AppState.allNodes;
+        const schedule = window.requestIdleCallback || (cb => setTimeout(() => cb({ timeRemaining: () => 8 }), 0));
+        let i = 0;
+        const step = (deadline) => {
+            while (i < nodes.length) {
+                this.getBlastRadius(nodes[i++].id);
+                if (deadline.timeRemaining() < 1) break;
             }
-            AppState.blastRadiusCache[nodeId] = visited.size - 1;
-        });
+            if (i < nodes.length) {
+                if (onProgress) onProgress();
+                schedule(step);
+            } else {
+                AppState.blastRadiusReady = true;
+                if (onDone) onDone();
+            }
+        };
+        schedule(step);
+    },
+    
+    // Runs the reachability DP in a worker when available so first paint isn't blocked;
+    // until it lands, getBlastRadius answers individual lookups. `onDone` fires once
+    // blastRadiusCache is complete.
+    computeBlastRadius(onDone, onProgress) {
+        const n = AppState.nodeIds.length;
+        const apply = radii => {
+            const { nodeIds, nodeMap, blastRadiusCache } = AppState;
+            for (let i = 0; i < n; i++) if (nodeMap[nodeIds[i]]) blastRadiusCache[nodeIds[i]] = radii[i];
+            AppState.blastRadiusReady = true;
+            if (onDone) onDone();
+        };
+        const { offsets, neighbors } = AppState.outAdj;
+        
+        let worker = null, url = null;
+        try {
+            url = URL.createObjectURL(new Blob([GRAPH_WORKER_SRC], { type: 'application/javascript' }));
+            worker = new Worker(url);
+        } catch (err) {
+            if (url) URL.revokeObjectURL(url);
+            this.fillBlastRadiusIdle(onProgress, onDone);
+            return;
+        }
+        const finish = () => { worker.terminate(); URL.revokeObjectURL(url); };
+        worker.onmessage = (e) => { finish(); apply(e.data.radii); };
+        worker.onerror = (e) => { e.preventDefault(); finish(); this.fillBlastRadiusIdle(onProgress, onDone); };
+        // Copies are transferred so the main thread keeps its adjacency
+        const message = { n, offsets: offsets.slice(), targets: neighbors.slice() };
+        worker.postMessage(message, [message.offsets.buffer, message.targets.buffer]);
     },
     
     getDomainForNode(node) {
@@ -1105,15 +1461,144 @@ const DataProcessor = {
     },
     
     getNodesByDomain() {
-        const groups = { 'Infrastructure': [], 'Configuration': [], 'Code': [], 'Data': [] };
-        Object.values(AppState.nodeMap).forEach(n => {
-            const domain = this.getDomainForNode(n);
-            if (groups[domain]) groups[domain].push(n);
-        });
-        return groups;
+        return AppState.domainGroups;
+    },
+    
+    // Groups nodes by domain once per index, GROUP_CHUNK nodes per idle slice so the
+    // root column can paint first and fill its counts in as groups grow. Once every
+    // node is placed, each group is sorted by blast radius (descending) then name, so
+    // opening a domain never sorts on the click path.
+    GROUP_CHUNK: 2000,
+    
+    groupByDomain(onProgress, onDone) {
+        const nodes = AppState.allNodes;
+        const groups = AppState.domainGroups;
+        const schedule = window.requestIdleCallback || (cb => setTimeout(cb, 0));
+        const step = (start) => {
+            const end = Math.min(start + this.GROUP_CHUNK, nodes.length);
+            for (let i = start; i < end; i++) groups[nodes[i]._domain]?.push(nodes[i]);
+            if (end < nodes.length) {
+                if (onProgress) onProgress();
+                schedule(() => step(end), { timeout: 50 });
+            } else {
+                this.sortDomainGroups();
+                if (onDone) onDone();
+            }
+        };
+        step(0);
+    },
+    
+    // Called again when the blast-radius pass completes; until then the order is by name
+    sortDomainGroups() {
+        const ready = AppState.blastRadiusReady;
+        const collator = new Intl.Collator();
+        for (const nodes of Object.values(AppState.domainGroups)) {
+            for (const n of nodes) n._sortRadius = ready ? this.getBlastRadius(n.id) : 0;
+            nodes.sort((a, b) => (b._sortRadius - a._sortRadius) || collator.compare(a.name, b.name));
+        }
     }
 };
 
+// ═══════════════════════════════════════════════════════════════════════════
+// VIRTUAL LIST
+// ═══════════════════════════════════════════════════════════════════════════
+
+// Detached row elements keyed by node id. A row that scrolls back into view, or a
+// node shown again in a later column, reuses its element and, when the markup is
+// unchanged, skips re-parsing its contents.
+const ItemPool = {
+    MAX_SIZE: 512,
+    free: new Map(),
+    
+    acquire(key) {
+        const el = this.free.get(key);
+        if (el) {
+            this.free.delete(key);
+            return el;
+        }
+        return document.createElement('div');
+    },
+    
+    release(el) {
+        el.remove();
+        const key = el.dataset.nodeId;
+        if (key === undefined || this.free.has(key)) return;
+        this.free.set(key, el);
+        if (this.free.size > this.MAX_SIZE) this.free.delete(this.free.keys().next().value);
+    }
+};
+
+const VirtualList = {
+    OVERSCAN: 4,
+    
+    // Renders only the rows intersecting the viewport of `container`. Row elements come
+    // from ItemPool under `keyOf(item)` and are filled by `renderRow(el, item, i, list)`
+    // when they enter the window; rows that stay in the window are left untouched.
+    create(container, items, renderRow, keyOf, rowHeight = 44) {
+        container.classList.add('virtual');
+        container.style.setProperty('--row-height', `${rowHeight}px`);
+        const spacer = document.createElement('div');
+        spacer.style.height = `${items.length * rowHeight}px`;
+        const viewport = document.createElement('div');
+        viewport.className = 'virtual-viewport';
+        container.appendChild(spacer);
+        container.appendChild(viewport);
+        
+        const list = { container, spacer, viewport, items, renderRow, keyOf, rowHeight, rows: new Map(), start: -1, end: -1, activeId: null, pending: false };
+        list.flush = () => { list.pending = false; this.update(list); };
+        container.addEventListener('scroll', onVirtualScroll);
+        container.virtualList = list;
+        this.update(list);
+        return list;
+    },
+    
+    update(list) {
+        const { container, items, rowHeight, rows } = list;
+        const first = Math.floor(container.scrollTop / rowHeight);
+        const visible = Math.ceil((container.clientHeight || window.innerHeight || 800) / rowHeight);
+        const start = Math.max(0, first - this.OVERSCAN);
+        const end = Math.min(items.length, first + visible + this.OVERSCAN);
+        if (start === list.start && end === list.end) return;
+        list.start = start;
+        list.end = end;
+        
+        for (const [i, el] of rows) {
+            if (i < start || i >= end) { ItemPool.release(el); rows.delete(i); }
+        }
+        for (let i = start; i < end; i++) {
+            if (rows.has(i)) continue;
+            const el = ItemPool.acquire(list.keyOf(items[i]));
+            list.renderRow(el, items[i], i, list);
+            el.dataset.idx = i;
+            el.style.top = `${i * rowHeight}px`;
+            list.viewport.appendChild(el);
+            rows.set(i, el);
+        }
+        container._activeItem = list.activeId === null ? null : list.viewport.querySelector('.item.active');
+    },
+    
+    // Swaps in a new item array, keeping the scroll position and active row
+    setItems(list, items) {
+        this.release(list);
+        list.items = items;
+        list.spacer.style.height = `${items.length * list.rowHeight}px`;
+        list.start = list.end = -1;
+        this.update(list);
+    },
+    
+    release(list) {
+        list.rows.forEach(el => ItemPool.release(el));
+        list.rows.clear();
+    }
+};
+
+function onVirtualScroll(e) {
+    const list = e.currentTarget.virtualList;
+    if (list.pending) return;
+    list.pending = true;
+    requestAnimationFrame(list.flush);
+}
+
 // ═══════════════════════════════════════════════════════════════════════════
 // DOM BUILDERS
 // ═══════════════════════════════════════════════════════════════════════════
@@ -1131,77 +1616,52 @@ const DOMBuilders = {
         return col;
     },
     
-    createDomainItem(domain, nodes) {
-        const blastTotal = nodes.reduce((sum, n) => sum + (AppState.blastRadiusCache[n.id] || 0), 0);
+    domainItemHtml(domain, nodes) {
+        // Averages wait for the full pass rather than forcing a BFS per node on first paint
+        const blastTotal = AppState.blastRadiusReady ? nodes.reduce((sum, n) => sum + DataProcessor.getBlastRadius(n.id), 0) : 0;
         const avgBlast = nodes.length > 0 ? Math.round(blastTotal / nodes.length) : 0;
         const riskLevel = Utils.getRiskLevel(avgBlast);
         
-        const item = document.createElement('div');
-        item.className = 'item';
-        item.dataset.domain = domain;
-        item.innerHTML = `
+        return `<div class="item" data-domain="${domain}">
             <div class="item-icon">${Utils.getCategoryIcon(domain)}</div>
             <div class="item-content">
                 <div class="item-title">${domain}</div>
                 <div class="item-subtitle">${nodes.length} artifact${nodes.length !== 1 ? 's' : ''}</div>
                 ${riskLevel ? `<div class="indicators"><span class="risk-indicator risk-indicator--${riskLevel}">⚡ ${avgBlast} avg</span></div>` : ''}
             </div>
-            <span class="item-chevron">›</span>`;
-        return item;
+            <span class="item-chevron">›</span>
+        </div>`;
     },
     
-    createNodeItem(node, edge = null, index = 0) {
-        const item = document.createElement('div');
-        let classes = ['item'];
+    fillNodeItem(el, node, edge = null, active = false) {
+        let classes = 'item';
         const changeType = node.metadata?.change_type;
-        if (changeType === 'added') classes.push('diff-added');
-        if (changeType === 'removed') classes.push('diff-removed');
-        if (changeType === 'modified') classes.push('diff-modified');
-        
-        item.className = classes.join(' ');
-        item.style.animationDelay = `${index * 0.02}s`;
-        item.dataset.nodeId = node.id;
+        if (changeType === 'added') classes += ' diff-added';
+        if (changeType === 'removed') classes += ' diff-removed';
+        if (changeType === 'modified') classes += ' diff-modified';
+        if (active) classes += ' active';
         
-        const icon = Utils.getNodeIcon(node.type, node.id);
-        const blastRadius = AppState.blastRadiusCache[node.id] || 0;
+        const blastRadius = DataProcessor.getBlastRadius(node.id);
         const riskLevel = Utils.getRiskLevel(blastRadius);
         
         let indicatorsHtml = '';
         if (edge || riskLevel) {
             indicatorsHtml = '<div class="indicators">';
-            if (edge) {
-                const conf = edge.confidence || 1;
-                const confLevel = Utils.getConfidenceLevel(conf);
-                indicatorsHtml += `<span class="confidence-indicator confidence-indicator--${confLevel}"><span class="confidence-dot"></span>${Utils.formatConfidence(conf)}%</span>`;
-            }
+            if (edge) indicatorsHtml += edge._badgeHtml;
             if (riskLevel) indicatorsHtml += `<span class="risk-indicator risk-indicator--${riskLevel}">⚡ ${blastRadius}</span>`;
             indicatorsHtml += '</div>';
         }
         
-        let edgeInfoHtml = '';
-        if (edge) {
-            const edgeIcon = Utils.getEdgeTypeIcon(edge.type);
-            const via = edge.metadata?.via || edge.metadata?.env_var || edge.metadata?.matched_key || '';
-            const edgeType = (edge.type || 'link').toUpperCase();
-            let badgeClass = '';
-            const et = (edge.type || '').toLowerCase();
-            if (et.includes('read')) badgeClass = 'edge-badge--reads';
-            else if (et.includes('provide')) badgeClass = 'edge-badge--provides';
-            else if (et.includes('provision')) badgeClass = 'edge-badge--provisions';
-            
-            edgeInfoHtml = `<div class="edge-info"><span class="edge-badge ${badgeClass}"><span class="edge-badge-icon">${edgeIcon}</span><span class="edge-badge-text">${edgeType}${via ? ` via ${via}` : ''}</span></span></div>`;
-        }
+        const edgeInfoHtml = edge ? edge._edgeInfoHtml : '';
         
-        item.innerHTML = `
-            <div class="item-icon">${icon}</div>
-            <div class="item-content">
-                <div class="item-title">${Utils.escapeHtml(node.name)}</div>
-                <div class="item-subtitle">${Utils.escapeHtml(node.type)}</div>
-                ${indicatorsHtml}
-                ${edgeInfoHtml}
-            </div>
-            <span class="item-chevron">›</span>`;
-        return item;
+        el.className = classes;
+        el.dataset.nodeId = node.id;
+        const html = `${node._staticHtml}${indicatorsHtml}${edgeInfoHtml}</div><span class="item-chevron">›</span>`;
+        if (el._html !== html) {
+            el.innerHTML = html;
+            el._html = html;
+        }
+        return el;
     }
 };
 
@@ -1211,124 +1671,213 @@ const DOMBuilders = {
 
 const ColumnRenderer = {
     wrapper: null,
+    // Fixed slot heights for virtualized rows (plain node rows / rows with an edge badge)
+    NODE_ROW_HEIGHT: 92,
+    EDGE_ROW_HEIGHT: 128,
     init() { this.wrapper = document.getElementById('columnsWrapper'); },
     
     removeColumnsAfter(index) {
-        while (this.wrapper.children.length > index + 1) this.wrapper.removeChild(this.wrapper.lastChild);
+        while (this.wrapper.children.length > index + 1) this.releaseColumn(this.wrapper.lastChild);
+    },
+    
+    // Detaches a column, returning its rows to ItemPool
+    releaseColumn(col) {
+        const list = col.querySelector('.column-list');
+        if (list && list.virtualList) VirtualList.release(list.virtualList);
+        this.wrapper.removeChild(col);
     },
     
     renderRootColumn() {
-        this.wrapper.innerHTML = '';
+        this.removeColumnsAfter(-1);
         AppState.tracePath = [];
         const groups = DataProcessor.getNodesByDomain();
-        const totalNodes = Object.values(AppState.nodeMap).length;
+        const totalNodes = AppState.allNodes.length;
         const col = DOMBuilders.createColumn('Domains', totalNodes, '🗂️');
         const list = col.querySelector('.column-list');
         
-        Object.entries(groups).forEach(([domain, nodes]) => {
-            if (nodes.length === 0) return;
-            const item = DOMBuilders.createDomainItem(domain, nodes);
-            item.onclick = () => {
-                this.highlightItem(item);
-                AppState.tracePath = [domain];
-                this.renderNodeList(nodes, domain, 0);
-            };
-            list.appendChild(item);
-        });
+        let html = '';
+        for (const [domain, nodes] of Object.entries(groups)) {
+            if (nodes.length > 0) html += DOMBuilders.domainItemHtml(domain, nodes);
+        }
+        list.innerHTML = html;
+        list.addEventListener('click', onDomainClick);
         this.wrapper.appendChild(col);
     },
     
+    // Delegated click/hover handling for a virtualized column; rows carry `data-idx`
+    // into `entries` ({ node, edge } pairs), which live on the list element.
+    bindList(list, entries, colIndex) {
+        list._entries = entries;
+        list._hovered = null;
+        list.dataset.col = colIndex;
+        list.addEventListener('click', onColumnClick);
+        list.addEventListener('mouseover', onColumnOver);
+        list.addEventListener('mouseout', onColumnOut);
+    },
+    
     renderNodeList(nodes, title, parentColIndex) {
         this.removeColumnsAfter(parentColIndex);
-        const sortedNodes = [...nodes].sort((a, b) => {
-            const brDiff = (AppState.blastRadiusCache[b.id] || 0) - (AppState.blastRadiusCache[a.id] || 0);
-            return brDiff !== 0 ? brDiff : a.name.localeCompare(b.name);
-        });
-        
         const icon = Utils.getCategoryIcon(title);
-        const col = DOMBuilders.createColumn(title, sortedNodes.length, icon);
+        const col = DOMBuilders.createColumn(title, nodes.length, icon);
         const list = col.querySelector('.column-list');
         const myColIndex = parentColIndex + 1;
+        this.wrapper.appendChild(col);
         
-        sortedNodes.forEach((node, idx) => {
-            const item = DOMBuilders.createNodeItem(node, null, idx);
-            item.onclick = () => {
-                this.highlightItem(item);
-                AppState.tracePath = AppState.tracePath.slice(0, myColIndex);
-                AppState.tracePath.push(node.id);
-                AppState.selectNode(node, null);
-                this.renderConnections(node, myColIndex);
-            };
-            item.onmouseenter = () => TraceHighlighter.highlight(node.id, myColIndex);
-            item.onmouseleave = () => TraceHighlighter.clear();
-            list.appendChild(item);
-        });
+        const entries = nodes.map(node => ({ node, edge: null }));
+        VirtualList.create(list, entries, renderEntryRow, entryKey, this.NODE_ROW_HEIGHT);
+        this.bindList(list, entries, myColIndex);
         
-        this.wrapper.appendChild(col);
         col.scrollIntoView({ behavior: 'smooth', inline: 'end' });
     },
     
+    // Refills an open domain column once its group is complete, leaving any
+    // columns to its right in place
+    refreshDomainColumn() {
+        const nodes = DataProcessor.getNodesByDomain()[AppState.tracePath[0]];
+        const col = this.wrapper.children[1];
+        const list = col?.querySelector('.column-list');
+        if (!nodes || !list?.virtualList) return;
+        const entries = nodes.map(node => ({ node, edge: null }));
+        list._entries = entries;
+        col.querySelector('.column-count').textContent = entries.length;
+        VirtualList.setItems(list.virtualList, entries);
+    },
+    
     renderConnections(node, parentColIndex) {
         this.removeColumnsAfter(parentColIndex);
         let connections = [], title = '', icon = '';
         
         if (AppState.mode === 'downstream') {
-            connections = (AppState.outgoingEdges[node.id] || []).map(e => ({ node: AppState.nodeMap[e.target_id], edge: e })).filter(c => c.node);
+            connections = DataProcessor.neighbors(node.id, AppState.outAdj);
             title = 'Impacts'; icon = '↓';
         } else {
-            connections = (AppState.incomingEdges[node.id] || []).map(e => ({ node: AppState.nodeMap[e.source_id], edge: e })).filter(c => c.node);
+            connections = DataProcessor.neighbors(node.id, AppState.inAdj);
             title = 'Dependencies'; icon = '↑';
         }
         
         if (connections.length === 0) return;
-        connections.sort((a, b) => (b.edge.confidence || 1) - (a.edge.confidence || 1));
         
         const col = DOMBuilders.createColumn(title, connections.length, icon);
         const list = col.querySelector('.column-list');
         const myColIndex = parentColIndex + 1;
+        this.wrapper.appendChild(col);
         
-        connections.forEach(({ node: connNode, edge }, idx) => {
-            const item = DOMBuilders.createNodeItem(connNode, edge, idx);
-            item.onclick = () => {
-                this.highlightItem(item);
-                AppState.tracePath = AppState.tracePath.slice(0, myColIndex);
-                AppState.tracePath.push(connNode.id);
-                AppState.selectNode(connNode, edge);
-                this.renderConnections(connNode, myColIndex);
-            };
-            item.onmouseenter = () => TraceHighlighter.highlight(connNode.id, myColIndex);
-            item.onmouseleave = () => TraceHighlighter.clear();
-            list.appendChild(item);
-        });
+        VirtualList.create(list, connections, renderEntryRow, entryKey, this.EDGE_ROW_HEIGHT);
+        this.bindList(list, connections, myColIndex);
         
-        this.wrapper.appendChild(col);
         col.scrollIntoView({ behavior: 'smooth', inline: 'end' });
     },
     
     highlightItem(item) {
-        Array.from(item.parentElement.children).forEach(c => c.classList.remove('active'));
+        const list = item.closest('.column-list');
+        if (list.virtualList) list.virtualList.activeId = item.dataset.nodeId;
+        list._activeItem?.classList.remove('active');
         item.classList.add('active');
+        list._activeItem = item;
     }
 };
 
+// Column event handlers are shared by every list; per-list state lives on the list
+// element (`_entries`, `_hovered`, `data-col`) instead of in per-list closures.
+
+function renderEntryRow(el, entry, i, list) {
+    DOMBuilders.fillNodeItem(el, entry.node, entry.edge, entry.node.id === list.activeId);
+}
+
+function entryKey(entry) {
+    return entry.node.id;
+}
+
+function onDomainClick(e) {
+    const item = e.target.closest('.item');
+    if (!item) return;
+    const domain = item.dataset.domain;
+    ColumnRenderer.highlightItem(item);
+    AppState.tracePath = [domain];
+    ColumnRenderer.renderNodeList(DataProcessor.getNodesByDomain()[domain], domain, 0);
+}
+
+function onColumnClick(e) {
+    const item = e.target.closest('.item');
+    if (!item) return;
+    const list = e.currentTarget;
+    const colIndex = +list.dataset.col;
+    const { node, edge } = list._entries[+item.dataset.idx];
+    ColumnRenderer.highlightItem(item);
+    AppState.tracePath = AppState.tracePath.slice(0, colIndex);
+    AppState.tracePath.push(node.id);
+    AppState.selectNode(node, edge);
+    ColumnRenderer.renderConnections(node, colIndex);
+}
+
+function onColumnOver(e) {
+    const item = e.target.closest('.item');
+    const list = e.currentTarget;
+    if (!item || item === list._hovered) return;
+    list._hovered = item;
+    TraceHighlighter.highlight(item.dataset.nodeId, +list.dataset.col);
+}
+
+function onColumnOut(e) {
+    const list = e.currentTarget;
+    const to = e.relatedTarget && e.relatedTarget.closest ? e.relatedTarget.closest('.item') : null;
+    if (to === list._hovered) return;
+    list._hovered = null;
+    TraceHighlighter.clear();
+}
+
 // ═══════════════════════════════════════════════════════════════════════════
 // TRACE HIGHLIGHTER
 // ═══════════════════════════════════════════════════════════════════════════
 
 const TraceHighlighter = {
-    highlight(nodeId, columnIndex) {
-        this.clear();
-        const wrapper = document.getElementById('columnsWrapper');
-        const columns = Array.from(wrapper.children);
-        for (let i = 0; i <= columnIndex; i++) columns[i]?.classList.add('in-trace-path');
-        AppState.tracePath.forEach(pathNodeId => {
-            document.querySelector(`.item[data-node-id="${pathNodeId}"]`)?.classList.add('in-trace');
+    // Hover requests are coalesced to one DOM update per frame; only the most recent
+    // request (or a clear) is applied.
+    pending: null,
+    frame: 0,
+    highlighted: new Set(),
+    pathFor: null,
+    pathEls: [],
+    
+    highlight(nodeId, columnIndex) { this.schedule({ nodeId, columnIndex }); },
+    clear() { this.schedule(null); },
+    
+    schedule(request) {
+        this.pending = request;
+        if (this.frame) return;
+        this.frame = requestAnimationFrame(() => {
+            this.frame = 0;
+            this.apply(this.pending);
         });
-        document.querySelector(`.item[data-node-id="${nodeId}"]`)?.classList.add('in-trace');
     },
-    clear() {
-        document.querySelectorAll('.in-trace-path').forEach(el => el.classList.remove('in-trace-path'));
-        document.querySelectorAll('.in-trace').forEach(el => el.classList.remove('in-trace'));
+    
+    mark(el, cls) {
+        if (!el) return;
+        el.classList.add(cls);
+        this.highlighted.add(el);
+    },
+    
+    // Path rows are looked up once per selection (tracePath is replaced on every
+    // selection) and again only if a virtual list re-rendered them.
+    pathElements() {
+        if (this.pathFor !== AppState.tracePath || this.pathEls.some(el => !el.isConnected)) {
+            this.pathFor = AppState.tracePath;
+            this.pathEls = AppState.tracePath
+                .map(id => document.querySelector(`.item[data-node-id="${id}"]`))
+                .filter(Boolean);
+        }
+        return this.pathEls;
+    },
+    
+    apply(request) {
+        this.highlighted.forEach(el => el.classList.remove('in-trace-path', 'in-trace'));
+        this.highlighted.clear();
+        if (!request) return;
+        
+        const columns = ColumnRenderer.wrapper.children;
+        for (let i = 0; i <= request.columnIndex && i < columns.length; i++) this.mark(columns[i], 'in-trace-path');
+        this.pathElements().forEach(el => this.mark(el, 'in-trace'));
+        this.mark(document.querySelector(`.item[data-node-id="${request.nodeId}"]`), 'in-trace');
     }
 };
 
@@ -1339,23 +1888,38 @@ const TraceHighlighter = {
 const Inspector = {
     element: null,
     currentTab: 'evidence',
+    activeTab: null,
+    activeContent: null,
+    node: null,
+    edge: null,
+    dirtyTabs: new Set(),
     
     init() {
         this.element = document.getElementById('inspector');
+        this.activeTab = document.querySelector('.inspector-tab.active');
+        this.activeContent = document.querySelector('.tab-content.active');
         document.querySelectorAll('.inspector-tab').forEach(tab => {
             tab.onclick = () => this.switchTab(tab.dataset.tab);
         });
+        document.getElementById('view-details').addEventListener('click', onDetailsClick);
+        document.getElementById('view-upstream').addEventListener('click', onDependencyClick);
+        document.getElementById('view-downstream').addEventListener('click', onDependencyClick);
     },
     
     switchTab(tabName) {
         this.currentTab = tabName;
-        document.querySelectorAll('.inspector-tab').forEach(t => t.classList.toggle('active', t.dataset.tab === tabName));
-        document.querySelectorAll('.tab-content').forEach(c => c.classList.toggle('active', c.id === `view-${tabName}`));
+        if (this.dirtyTabs.delete(tabName)) this.renderTab(tabName);
+        this.activeTab?.classList.remove('active');
+        this.activeContent?.classList.remove('active');
+        this.activeTab = document.querySelector(`.inspector-tab[data-tab="${tabName}"]`);
+        this.activeContent = document.getElementById(`view-${tabName}`);
+        this.activeTab?.classList.add('active');
+        this.activeContent?.classList.add('active');
     },
     
     update(node, contextEdge = null) {
         this.element.classList.add('visible');
-        document.getElementById('insp-icon').textContent = Utils.getNodeIcon(node.type, node.id);
+        document.getElementById('insp-icon').textContent = node._icon;
         document.getElementById('insp-title').textContent = node.name;
         document.getElementById('insp-id').textContent = node.id;
         
@@ -1363,27 +1927,41 @@ const Inspector = {
         btnEditor.disabled = !node.path;
         btnEditor.title = node.path || 'No file path available';
         
-        const upEdges = AppState.incomingEdges[node.id] || [];
-        const downEdges = AppState.outgoingEdges[node.id] || [];
-        document.getElementById('tab-up-count').textContent = upEdges.length;
-        document.getElementById('tab-down-count').textContent = downEdges.length;
+        document.getElementById('tab-up-count').textContent = DataProcessor.degree(node.id, AppState.inAdj);
+        document.getElementById('tab-down-count').textContent = DataProcessor.degree(node.id, AppState.outAdj);
         
-        this.renderEvidenceTab(node, contextEdge);
-        this.renderDetailsTab(node);
-        this.renderDependencyTab('view-upstream', upEdges, 'source_id');
-        this.renderDependencyTab('view-downstream', downEdges, 'target_id');
+        // Only the visible tab is rendered; the others are rebuilt when switched to
+        this.node = node;
+        this.edge = contextEdge;
+        this.dirtyTabs = new Set(['evidence', 'details', 'upstream', 'downstream']);
         this.switchTab('evidence');
     },
     
+    // Evidence and Details show the blast radius; once the full pass lands they are
+    // redrawn without moving the user off the tab they are on
+    refreshBlastRadius() {
+        if (!this.node) return;
+        this.dirtyTabs.add('evidence');
+        this.dirtyTabs.add('details');
+        if (this.dirtyTabs.delete(this.currentTab)) this.renderTab(this.currentTab);
+    },
+    
+    renderTab(tabName) {
+        const node = this.node;
+        if (tabName === 'evidence') this.renderEvidenceTab(node, this.edge);
+        else if (tabName === 'details') this.renderDetailsTab(node);
+        else if (tabName === 'upstream') this.renderDependencyTab('view-upstream', DataProcessor.neighbors(node.id, AppState.inAdj));
+        else if (tabName === 'downstream') this.renderDependencyTab('view-downstream', DataProcessor.neighbors(node.id, AppState.outAdj));
+    },
+    
     renderEvidenceTab(node, edge) {
         const container = document.getElementById('view-evidence');
-        const blastRadius = AppState.blastRadiusCache[node.id] || 0;
+        const blastRadius = DataProcessor.getBlastRadius(node.id);
         let html = '';
         
         if (edge) {
-            const conf = edge.confidence || 1;
-            const confLevel = Utils.getConfidenceLevel(conf);
-            const confPercent = Utils.formatConfidence(conf);
+            const confLevel = edge._confLevel;
+            const confPercent = edge._confPct;
             
             html += `<div class="strength-meter">
                 <div class="strength-header">
@@ -1467,10 +2045,18 @@ const Inspector = {
     
     renderDetailsTab(node) {
         const container = document.getElementById('view-details');
-        let metadataRows = Object.entries(node.metadata || {}).map(([k, v]) => 
-            `<div class="detail-row"><span class="detail-label">${Utils.escapeHtml(k)}</span><span class="detail-value">${Utils.escapeHtml(JSON.stringify(v))}</span></div>`
-        ).join('');
+        const metadata = node.metadata || {};
+        // Nested values are only stringified when their row is expanded
+        let metadataRows = Object.keys(metadata).map(k => {
+            const v = metadata[k];
+            const label = `<span class="detail-label">${Utils.escapeHtml(k)}</span>`;
+            if (v === null || typeof v !== 'object') {
+                return `<div class="detail-row">${label}<span class="detail-value">${Utils.escapeHtml(String(v))}</span></div>`;
+            }
+            return `<div class="detail-row" data-k="${Utils.escapeHtml(k)}">${label}<span class="detail-value clickable">${metadataSummary(v)}</span></div>`;
+        }).join('');
         
+        container._metadata = metadata;
         container.innerHTML = `
             <div class="detail-section">
                 <div class="detail-section-title">Core Properties</div>
@@ -1481,48 +2067,64 @@ const Inspector = {
             ${metadataRows ? `<div class="detail-section"><div class="detail-section-title">Metadata</div>${metadataRows}</div>` : ''}
             <div class="detail-section">
                 <div class="detail-section-title">Impact Analysis</div>
-                <div class="detail-row"><span class="detail-label">Blast Radius</span><span class="detail-value">${AppState.blastRadiusCache[node.id] || 0} downstream</span></div>
-                <div class="detail-row"><span class="detail-label">Upstream</span><span class="detail-value">${(AppState.incomingEdges[node.id] || []).length} deps</span></div>
-                <div class="detail-row"><span class="detail-label">Downstream</span><span class="detail-value">${(AppState.outgoingEdges[node.id] || []).length} deps</span></div>
+                <div class="detail-row"><span class="detail-label">Blast Radius</span><span class="detail-value">${DataProcessor.getBlastRadius(node.id)} downstream</span></div>
+                <div class="detail-row"><span class="detail-label">Upstream</span><span class="detail-value">${DataProcessor.degree(node.id, AppState.inAdj)} deps</span></div>
+                <div class="detail-row"><span class="detail-label">Downstream</span><span class="detail-value">${DataProcessor.degree(node.id, AppState.outAdj)} deps</span></div>
             </div>`;
     },
     
-    renderDependencyTab(elementId, edges, nodeKey) {
+    renderDependencyTab(elementId, deps) {
         const container = document.getElementById(elementId);
-        if (edges.length === 0) {
+        if (deps.length === 0) {
             container.innerHTML = '<div class="empty-state"><div class="empty-state-icon">📭</div><div>No dependencies found</div></div>';
             return;
         }
         
-        container.innerHTML = `<div class="dep-list">${edges.map(edge => {
-            const otherNode = AppState.nodeMap[edge[nodeKey]];
-            if (!otherNode) return '';
-            const icon = Utils.getNodeIcon(otherNode.type, otherNode.id);
-            const conf = edge.confidence || 1;
-            const confLevel = Utils.getConfidenceLevel(conf);
-            return `<div class="dep-item" onclick="jumpToNode('${otherNode.id}')">
-                <span class="dep-item-icon">${icon}</span>
+        container.innerHTML = `<div class="dep-list">${deps.map(({ node: otherNode, edge }) => {
+            return `<div class="dep-item" data-node-id="${otherNode._idEsc}">
+                <span class="dep-item-icon">${otherNode._icon}</span>
                 <div class="dep-item-content">
-                    <div class="dep-item-name">${Utils.escapeHtml(otherNode.name)}</div>
-                    <div class="dep-item-type">${Utils.escapeHtml(otherNode.type)}</div>
+                    <div class="dep-item-name">${otherNode._nameEsc}</div>
+                    <div class="dep-item-type">${otherNode._typeEsc}</div>
                 </div>
-                <span class="confidence-indicator confidence-indicator--${confLevel}"><span class="confidence-dot"></span>${Utils.formatConfidence(conf)}%</span>
+                ${edge._badgeHtml}
             </div>`;
         }).join('')}</div>`;
     }
 };
 
+function metadataSummary(v) {
+    return (Array.isArray(v) ? `[${v.length}]` : '{…}') + ' ▸';
+}
+
+function onDetailsClick(e) {
+    const row = e.target.closest('[data-k]');
+    if (!row) return;
+    const v = e.currentTarget._metadata[row.dataset.k];
+    const value = row.querySelector('.detail-value');
+    const expand = !value.classList.contains('expanded');
+    value.classList.toggle('expanded', expand);
+    value.textContent = expand ? JSON.stringify(v, null, 2) : metadataSummary(v);
+}
+
+function onDependencyClick(e) {
+    const dep = e.target.closest('.dep-item');
+    if (dep) jumpToNode(dep.dataset.nodeId);
+}
+
 // ═══════════════════════════════════════════════════════════════════════════
 // SEARCH
 // ═══════════════════════════════════════════════════════════════════════════
 
 const Search = {
+    MAX_RESULTS: 12,
+    DEBOUNCE_MS: 30,
     input: null, results: null,
     
     init() {
         this.input = document.querySelector('.search-input');
         this.results = document.getElementById('searchResults');
-        this.input.addEventListener('input', Utils.debounce((e) => this.handleSearch(e.target.value), 150));
+        this.input.addEventListener('input', Utils.debounce((e) => this.handleSearch(e.target.value), this.DEBOUNCE_MS));
         this.input.addEventListener('focus', () => { if (this.input.value.length >= 2) this.results.classList.add('visible'); });
         document.addEventListener('click', (e) => { if (!e.target.closest('.search-container')) this.results.classList.remove('visible'); });
     },
@@ -1530,19 +2132,21 @@ const Search = {
     handleSearch(query) {
         if (query.length < 2) { this.results.classList.remove('visible'); return; }
         const queryLower = query.toLowerCase();
-        const matches = Object.values(AppState.nodeMap).filter(n => 
-            n.name.toLowerCase().includes(queryLower) || n.id.toLowerCase().includes(queryLower)
-        ).slice(0, 12);
+        const nodes = AppState.allNodes;
+        const matches = [];
+        for (let i = 0; i < nodes.length && matches.length < this.MAX_RESULTS; i++) {
+            const n = nodes[i];
+            if (n._nameLower.includes(queryLower) || n._idLower.includes(queryLower)) matches.push(n);
+        }
         
         if (matches.length > 0) {
             this.results.innerHTML = matches.map(node => {
-                const icon = Utils.getNodeIcon(node.type, node.id);
-                const highlighted = this.highlightMatch(node.name, query);
+                const highlighted = this.highlightMatch(node, queryLower);
                 return `<div class="search-item" onclick="jumpToNode('${node.id}')">
-                    <span class="search-item-icon">${icon}</span>
+                    <span class="search-item-icon">${node._icon}</span>
                     <div class="search-item-content">
                         <div class="search-item-name">${highlighted}</div>
-                        <div class="search-item-type">${Utils.escapeHtml(node.type)}</div>
+                        <div class="search-item-type">${node._typeEsc}</div>
                     </div>
                 </div>`;
             }).join('');
@@ -1553,10 +2157,11 @@ const Search = {
         }
     },
     
-    highlightMatch(text, query) {
-        const idx = text.toLowerCase().indexOf(query.toLowerCase());
-        if (idx === -1) return Utils.escapeHtml(text);
-        return `${Utils.escapeHtml(text.slice(0, idx))}<strong>${Utils.escapeHtml(text.slice(idx, idx + query.length))}</strong>${Utils.escapeHtml(text.slice(idx + query.length))}`;
+    highlightMatch(node, queryLower) {
+        const text = node.name || '';
+        const idx = node._nameLower.indexOf(queryLower);
+        if (idx === -1) return node._nameEsc;
+        return `${Utils.escapeHtml(text.slice(0, idx))}<strong>${Utils.escapeHtml(text.slice(idx, idx + queryLower.length))}</strong>${Utils.escapeHtml(text.slice(idx + queryLower.length))}`;
     }
 };
 
@@ -1566,6 +2171,10 @@ const Search = {
 
 const MeshVisualization = {
     modal: null,
+    // Layout settles in ~60 ticks instead of d3's default ~300
+    ALPHA_MIN: 0.05,
+    ALPHA_DECAY: 0.05,
+    LABEL_MIN_ZOOM: 0.6,
     init() { this.modal = document.getElementById('meshModal'); },
     open() {
         if (!AppState.currentNode) return;
@@ -1581,42 +2190,142 @@ const MeshVisualization = {
         container.innerHTML = '';
         const width = container.clientWidth, height = container.clientHeight;
         
-        const nodeSet = new Set([centerNode.id]);
+        // Neighbourhood in dense indices: `local[v]` is v's position in graphNodes (-1 if
+        // unseen), and links refer to those positions, which forceLink accepts directly
+        const { nodeIds, inAdj, outAdj } = AppState;
+        const u = AppState.nodeIdx[centerNode.id];
+        const local = new Int32Array(nodeIds.length).fill(-1);
+        const members = [u];
         const links = [];
+        local[u] = 0;
+        const visit = v => {
+            if (local[v] === -1) { local[v] = members.length; members.push(v); }
+            return local[v];
+        };
+        for (let k = inAdj.offsets[u]; k < inAdj.offsets[u + 1]; k++) links.push({ source: visit(inAdj.neighbors[k]), target: 0 });
+        for (let k = outAdj.offsets[u]; k < outAdj.offsets[u + 1]; k++) links.push({ source: 0, target: visit(outAdj.neighbors[k]) });
         
-        [...(AppState.incomingEdges[centerNode.id] || []), ...(AppState.outgoingEdges[centerNode.id] || [])].forEach(e => {
-            nodeSet.add(e.source_id); nodeSet.add(e.target_id);
-            links.push({ source: e.source_id, target: e.target_id });
+        const graphNodes = members.map(v => {
+            const id = nodeIds[v];
+            return { id, name: AppState.nodeMap[id]?.name || id, isCenter: v === u };
         });
         
-        const graphNodes = Array.from(nodeSet).map(id => ({ id, name: AppState.nodeMap[id]?.name || id, isCenter: id === centerNode.id }));
+        // Settled positions from an earlier open of the same neighbourhood
+        const cached = AppState.meshLayoutCache[centerNode.id];
+        if (cached) graphNodes.forEach((d, i) => { d.x = cached[i].x; d.y = cached[i].y; });
         
-        const svg = d3.select("#mesh-container").append("svg").attr("width", width).attr("height", height);
-        const g = svg.append("g");
-        svg.call(d3.zoom().scaleExtent([0.2, 4]).on("zoom", (event) => g.attr("transform", event.transform)));
+        const dpr = window.devicePixelRatio || 1;
+        const canvas = container.appendChild(document.createElement('canvas'));
+        canvas.width = width * dpr;
+        canvas.height = height * dpr;
+        canvas.style.width = `${width}px`;
+        canvas.style.height = `${height}px`;
+        const ctx = canvas.getContext('2d');
+        let transform = d3.zoomIdentity;
         
         const simulation = d3.forceSimulation(graphNodes)
-            .force("link", d3.forceLink(links).id(d => d.id).distance(80))
+            .force("link", d3.forceLink(links).distance(80))
             .force("charge", d3.forceManyBody().strength(-200))
-            .force("center", d3.forceCenter(width / 2, height / 2));
+            .force("center", d3.forceCenter(width / 2, height / 2))
+            .alphaMin(this.ALPHA_MIN)
+            .alphaDecay(this.ALPHA_DECAY);
         
-        const link = g.append("g").selectAll("line").data(links).join("line").attr("stroke", "#555").attr("stroke-opacity", 0.6);
-        const node = g.append("g").selectAll("g").data(graphNodes).join("g")
-            .call(d3.drag().on("start", (e) => { if (!e.active) simulation.alphaTarget(0.3).restart(); e.subject.fx = e.subject.x; e.subject.fy = e.subject.y; })
-            .on("drag", (e) => { e.subject.fx = e.x; e.subject.fy = e.y; })
-            .on("end", (e) => { if (!e.active) simulation.alphaTarget(0); e.subject.fx = null; e.subject.fy = null; }))
-            .on("click", (e, d) => { this.close(); jumpToNode(d.id); });
+        // One path for all links and one per node colour, so a frame is a handful of draw calls
+        const draw = () => {
+            ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+            ctx.clearRect(0, 0, width, height);
+            ctx.translate(transform.x, transform.y);
+            ctx.scale(transform.k, transform.k);
+            
+            ctx.beginPath();
+            for (const l of links) { ctx.moveTo(l.source.x, l.source.y); ctx.lineTo(l.target.x, l.target.y); }
+            ctx.strokeStyle = 'rgba(85, 85, 85, 0.6)';
+            ctx.stroke();
+            
+            ctx.beginPath();
+            for (const d of graphNodes) {
+                if (d.isCenter) continue;
+                ctx.moveTo(d.x + 8, d.y);
+                ctx.arc(d.x, d.y, 8, 0, 2 * Math.PI);
+            }
+            ctx.fillStyle = '#3b82f6';
+            ctx.fill();
+            ctx.beginPath();
+            for (const d of graphNodes) if (d.isCenter) ctx.arc(d.x, d.y, 12, 0, 2 * Math.PI);
+            ctx.fillStyle = '#fff';
+            ctx.fill();
+            
+            if (transform.k >= this.LABEL_MIN_ZOOM) {
+                ctx.font = '10px sans-serif';
+                ctx.fillStyle = '#ccc';
+                for (const d of graphNodes) ctx.fillText(d.name, d.x + 14, d.y + 4);
+            }
+        };
         
-        node.append("circle").attr("r", d => d.isCenter ? 12 : 8).attr("fill", d => d.isCenter ? "#fff" : "#3b82f6");
-        node.append("text").text(d => d.name).attr("x", 14).attr("y", 4).style("font-size", "10px").style("fill", "#ccc");
+        const nodeAt = (event) => {
+            const [px, py] = transform.invert(d3.pointer(event, canvas));
+            let best = null, bestDist = 144;
+            for (const d of graphNodes) {
+                const dist = (d.x - px) ** 2 + (d.y - py) ** 2;
+                if (dist < bestDist) { best = d; bestDist = dist; }
+            }
+            return best;
+        };
         
-        simulation.on("tick", () => {
-            link.attr("x1", d => d.source.x).attr("y1", d => d.source.y).attr("x2", d => d.target.x).attr("y2", d => d.target.y);
-            node.attr("transform", d => `translate(${d.x},${d.y})`);
-        });
+        // Drag is bound before zoom so a press on a node drags it instead of panning
+        d3.select(canvas)
+            .call(d3.drag()
+                .subject((e) => nodeAt(e.sourceEvent))
+                .on("start", (e) => { if (!e.active) simulation.alphaTarget(0.3).restart(); e.subject.fx = e.subject.x; e.subject.fy = e.subject.y; })
+                .on("drag", (e) => { const [x, y] = transform.invert(d3.pointer(e.sourceEvent, canvas)); e.subject.fx = x; e.subject.fy = y; })
+                .on("end", (e) => { if (!e.active) simulation.alphaTarget(0); e.subject.fx = null; e.subject.fy = null; }))
+            .call(d3.zoom().scaleExtent([0.2, 4]).on("zoom", (e) => { transform = e.transform; draw(); }))
+            .on("click", (e) => {
+                const d = nodeAt(e);
+                if (d) { this.close(); jumpToNode(d.id); }
+            });
+        
+        simulation.on("tick", draw);
+        
+        if (cached) {
+            simulation.stop();
+            draw();
+        } else {
+            simulation.on("end", () => {
+                AppState.meshLayoutCache[centerNode.id] = graphNodes.map(d => ({ id: d.id, x: d.x, y: d.y }));
+            });
+        }
     }
 };
 
+// ═══════════════════════════════════════════════════════════════════════════
+// GRAPH PAYLOAD
+// ═══════════════════════════════════════════════════════════════════════════
+
+// The graph is embedded as an application/json script block so it goes through
+// JSON.parse, which is far cheaper than compiling a multi-megabyte object literal.
+function loadGraphData() {
+    const el = document.getElementById('graph-data');
+    if (!el) return undefined;
+    const data = JSON.parse(el.textContent);
+    return data.endpoints === undefined ? data : decodeEndpoints(data);
+}
+
+// Binary payloads carry edge records without endpoints plus a base64 varint stream
+// of (delta source index, target index) pairs indexing node ids then `extra_ids`.
+function decodeEndpoints(data) {
+    const bytes = Uint8Array.from(atob(data.endpoints), c => c.charCodeAt(0));
+    const ids = data.nodes.map(n => n.id).concat(data.extra_ids);
+    let pos = 0, source = 0;
+    const next = () => {
+        let value = 0, scale = 1, b;
+        do { b = bytes[pos++]; value += (b & 0x7f) * scale; scale *= 128; } while (b & 0x80);
+        return value;
+    };
+    data.edges.forEach(e => { source += next(); e.source_id = ids[source]; e.target_id = ids[next()]; });
+    return { nodes: data.nodes, edges: data.edges };
+}
+
 // ═══════════════════════════════════════════════════════════════════════════
 // GLOBAL FUNCTIONS & INITIALIZATION
 // ═══════════════════════════════════════════════════════════════════════════
@@ -1626,7 +2335,7 @@ function jumpToNode(nodeId) {
     document.querySelector('.search-input').value = '';
     const node = AppState.nodeMap[nodeId];
     if (!node) return;
-    const domain = DataProcessor.getDomainForNode(node);
+    const domain = node._domain;
     ColumnRenderer.renderRootColumn();
     setTimeout(() => {
         document.querySelectorAll('.column:first-child .item').forEach(item => {
@@ -1650,22 +2359,36 @@ function setMode(mode) {
 }
 
 function updateStats() {
-    document.getElementById('stat-nodes').textContent = Object.keys(AppState.nodeMap).length;
-    document.getElementById('stat-edges').textContent = (rawData.edges || []).length;
-    document.getElementById('stat-risk').textContent = Object.values(AppState.blastRadiusCache).filter(br => br > 5).length;
+    document.getElementById('stat-nodes').textContent = AppState.allNodes.length;
+    document.getElementById('stat-edges').textContent = AppState.edges.length;
+    const risky = Object.values(AppState.blastRadiusCache).filter(br => br > 5).length;
+    document.getElementById('stat-risk').textContent = AppState.blastRadiusReady ? risky : `${risky}…`;
 }
 
 window.onload = function() {
-    if (typeof rawData !== 'undefined') {
+    const rawData = loadGraphData();
+    if (rawData) {
         DataProcessor.indexGraphData(rawData);
         ColumnRenderer.init();
         Inspector.init();
         Search.init();
         MeshVisualization.init();
-        ColumnRenderer.renderRootColumn();
         updateStats();
         
+        // The first grouping slice runs synchronously and paints the root column;
+        // later slices refresh its counts until the user navigates away from it, and
+        // a domain opened before grouping finished is refilled once it does
+        const refreshRoot = () => { if (AppState.tracePath.length === 0) ColumnRenderer.renderRootColumn(); };
+        const onGrouped = () => { refreshRoot(); if (AppState.tracePath.length > 0) ColumnRenderer.refreshDomainColumn(); };
+        DataProcessor.groupByDomain(refreshRoot, onGrouped);
         AppState.subscribe('nodeSelect', ({ node, edge }) => Inspector.update(node, edge));
+        AppState.subscribe('blastRadiusReady', () => {
+            DataProcessor.sortDomainGroups();
+            updateStats();
+            refreshRoot();
+            Inspector.refreshBlastRadius();
+        });
+        DataProcessor.computeBlastRadius(() => AppState.emit('blastRadiusReady'), updateStats);
     }
     
     document.addEventListener('keydown', (e) => {
@@ -1769,14 +2492,88 @@ HTML_TEMPLATE = """<!DOCTYPE html>
         </div>
     </div>
 
+    <script type="application/json" id="graph-data">{data}</script>
     <script>
-        const rawData = {data};
         {scripts}
     </script>
 </body>
 </html>"""
 
 
-def build_html(graph_json: str) -> str:
-    """Assemble the final HTML using embedded assets."""
-    return HTML_TEMPLATE.format(styles=CSS_CONTENT, data=graph_json, scripts=JS_CONTENT)
+_CSS_COMMENT = re.compile(rb"/\*.*?\*/", re.DOTALL)
+_CSS_WHITESPACE = re.compile(rb"\s+")
+_CSS_PUNCTUATION = re.compile(rb"\s*([{};,>])\s*")
+
+
+def _minify_css(css: bytes) -> bytes:
+    """Strip comments and redundant whitespace from the stylesheet."""
+    css = _CSS_COMMENT.sub(b"", css)
+    css = _CSS_WHITESPACE.sub(b" ", css)
+    css = _CSS_PUNCTUATION.sub(rb"\1", css)
+    # Drop the space after declaration colons only; a leading space before ':'
+    # is significant in selectors (".a :hover").
+    return css.replace(b": ", b":").replace(b";}", b"}").strip()
+
+
+def _minify_js(js: str) -> str:
+    """
+    Drop indentation, blank lines and full-line ``//`` comments from the script.
+
+    Newlines are preserved so automatic semicolon insertion and string/regex
+    literals are never affected.
+    """
+    lines = (line.strip() for line in js.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
+def _render_segments() -> tuple[bytes, bytes]:
+    """
+    Render the static HTML around the graph payload.
+
+    The template is split at its ``{data}`` placeholder so the CSS/JS assets are
+    minified, interpolated and encoded exactly once, at import time.
+    """
+    head, marker, tail = HTML_TEMPLATE.partition("{data}")
+    if not marker:
+        raise ValueError("HTML_TEMPLATE is missing the {data} placeholder")
+    # CSS_CONTENT is already bytes, so it is spliced in without an encode pass.
+    before_styles, _, after_styles = head.partition("{styles}")
+    return (
+        before_styles.encode("utf-8") + _minify_css(CSS_CONTENT) + after_styles.encode("utf-8"),
+        tail.format(scripts=_minify_js(JS_CONTENT)).encode("utf-8"),
+    )
+
+
+_HTML_PREFIX, _HTML_SUFFIX = _render_segments()
+
+# Concatenated gzip members decompress to the concatenation of their payloads,
+# so the static segments only ever need to go through zlib once.
+_HTML_PREFIX_GZ = gzip.compress(_HTML_PREFIX, compresslevel=6)
+_HTML_SUFFIX_GZ = gzip.compress(_HTML_SUFFIX, compresslevel=6)
+
+
+_SCRIPT_UNSAFE = re.compile(rb"<")
+
+
+def _escape_script_data(graph_json: bytes | memoryview) -> bytes | memoryview:
+    """
+    Make a JSON payload safe to embed in a ``<script>`` element.
+
+    ``<`` can only occur inside JSON strings, where ``\\u003c`` is an equivalent
+    escape, so no ``</script>`` or ``<!--`` sequence survives. Payloads without
+    one are returned as-is, without a copy.
+    """
+    if _SCRIPT_UNSAFE.search(graph_json) is None:
+        return graph_json
+    return bytes(graph_json).replace(b"<", b"\\u003c")
+
+
+def build_html(graph_json: bytes | memoryview) -> bytes:
+    """Assemble the final UTF-8 HTML document using the cached template segments."""
+    return _HTML_PREFIX + _escape_script_data(graph_json) + _HTML_SUFFIX
+
+
+def build_html_gz(graph_json: bytes | memoryview) -> bytes:
+    """Assemble the gzip-compressed HTML document, compressing only the payload."""
+    payload = gzip.compress(_escape_script_data(graph_json), compresslevel=6)
+    return _HTML_PREFIX_GZ + payload + _HTML_SUFFIX_GZ
@@ -15,7 +15,7 @@ Supports incremental parsing via file hash tracking.
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Generator, List, Set
+from typing import Any, Dict, Generator, List, Set, Tuple
 
 try:
     from tree_sitter_languages import get_language, get_parser
@@ -80,6 +80,9 @@ class TreeSitterEngine:
     def __init__(self):
         self._configs: Dict[str, LanguageConfig] = {}
         self._extension_map: Dict[str, str] = {}
+        # Grammar objects and compiled queries, built on first use per language
+        self._grammars: Dict[str, Tuple[Any, Any]] = {}
+        self._queries: Dict[str, List[Any]] = {}
 
     def register_language(self, config: LanguageConfig) -> None:
         """Register a language configuration."""
@@ -92,6 +95,26 @@ class TreeSitterEngine:
         ext = file_path.suffix.lower()
         return self._extension_map.get(ext)
 
+    def _get_grammar(self, config: LanguageConfig) -> Tuple[Any, Any]:
+        """Return the (parser, language) pair for a language, creating it once."""
+        grammar = self._grammars.get(config.name)
+        if grammar is None:
+            grammar = (get_parser(config.tree_sitter_name), get_language(config.tree_sitter_name))
+            self._grammars[config.name] = grammar
+        return grammar
+
+    def _get_queries(self, config: LanguageConfig, language: Any) -> List[Any]:
+        """Return the compiled queries for a language, reading the query files once."""
+        queries = self._queries.get(config.name)
+        if queries is None:
+            queries = [
+                language.query(query_path.read_text())
+                for query_path in config.query_paths
+                if query_path.exists()
+            ]
+            self._queries[config.name] = queries
+        return queries
+
     def parse_file(self, file_path: Path) -> Generator[Node | Edge, None, None]:
         """
         Parse a source file and yield nodes and edges.
@@ -119,16 +142,10 @@ class TreeSitterEngine:
             if not TREE_SITTER_AVAILABLE:
                 return
 
-            parser = get_parser(config.tree_sitter_name)
+            parser, language = self._get_grammar(config)
             tree = parser.parse(content)
-            language = get_language(config.tree_sitter_name)
-
-            for query_path in config.query_paths:
-                if not query_path.exists():
-                    continue
 
-                query_scm = query_path.read_text()
-                query = language.query(query_scm)
+            for query in self._get_queries(config, language):
                 captures = query.captures(tree.root_node)
 
                 yield from self._process_captures(captures, file_id, lang_name, str(file_path))
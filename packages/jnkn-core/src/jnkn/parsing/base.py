@@ -14,6 +14,7 @@ Architecture Goals:
 
 from __future__ import annotations
 
+import bisect
 import logging
 import re
 from abc import ABC, abstractmethod
@@ -26,6 +27,8 @@ from ..core.types import Edge, Node, NodeType, RelationshipType
 
 logger = logging.getLogger(__name__)
 
+_NEWLINE = re.compile("\n")
+
 
 # =============================================================================
 # Parser Context
@@ -168,12 +171,21 @@ class ExtractionContext:
     tree: Any | None = None
     seen_ids: Set[str] = field(default_factory=set)
     source_repo: str | None = None
+    _line_starts: List[int] | None = field(default=None, init=False, repr=False, compare=False)
+    _entity_prefix: str | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def infra_prefix(self) -> str:
         """Get the prefix to use for infrastructure node IDs."""
         return self.source_repo or "infra"
 
+    @property
+    def entity_prefix(self) -> str:
+        """Get the ID prefix shared by every code entity in this file."""
+        if self._entity_prefix is None:
+            self._entity_prefix = f"entity:{self.file_path}:"
+        return self._entity_prefix
+
     # -------------------------------------------------------------------------
     # Node Factory Methods
     # -------------------------------------------------------------------------
@@ -407,7 +419,7 @@ class ExtractionContext:
         Returns:
             Node: A CODE_ENTITY node.
         """
-        entity_id = f"entity:{self.file_path}:{name}"
+        entity_id = self.entity_prefix + name
 
         meta = {
             "entity_type": entity_type,
@@ -490,7 +502,11 @@ class ExtractionContext:
         Returns:
             int: 1-indexed line number.
         """
-        return self.text[:position].count("\n") + 1
+        # Line start offsets are computed once per context, so each lookup is a
+        # binary search instead of a count over the text before the match
+        if self._line_starts is None:
+            self._line_starts = [0] + [m.end() for m in _NEWLINE.finditer(self.text)]
+        return bisect.bisect_right(self._line_starts, position)
 
     def mark_seen(self, identifier: str) -> bool:
         """
@@ -632,6 +648,9 @@ class ExtractorRegistry:
         Execute all registered extractors against the provided context.
 
         Failures in individual extractors are logged but do not halt the process.
+        Extractors that also provide `extract_list(ctx)` are run through it, which
+        builds their results without suspending a generator per item; a failure
+        there discards that extractor's results for the file.
 
         Args:
             ctx: The extraction context.
@@ -642,7 +661,11 @@ class ExtractorRegistry:
         for extractor in self._extractors:
             if extractor.can_extract(ctx):
                 try:
-                    yield from extractor.extract(ctx)
+                    extract_list = getattr(extractor, "extract_list", None)
+                    if extract_list is not None:
+                        yield from extract_list(ctx)
+                    else:
+                        yield from extractor.extract(ctx)
                 except Exception as e:
                     logger.debug(f"Extractor {extractor.name} failed on {ctx.file_path}: {e}")
 
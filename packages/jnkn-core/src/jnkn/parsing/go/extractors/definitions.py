@@ -1,10 +1,17 @@
 import re
-from typing import Generator, Union
+from typing import Generator, List, Union
 
 from ....core.types import Edge, Node
 from ...base import ExtractionContext
 
 
+def _is_exported(name: str) -> bool:
+    """Go exports identifiers that start with an upper-case letter."""
+    first = name[0]
+    # ASCII compare first; non-ASCII identifiers fall back to the Unicode check
+    return "A" <= first <= "Z" or (first > "\x7f" and first.isupper())
+
+
 class GoDefinitionExtractor:
     """
     Extract function and type definitions from Go code.
@@ -19,73 +26,48 @@ class GoDefinitionExtractor:
     name = "go_definitions"
     priority = 80
 
-    # func FunctionName(...)
-    FUNC_DEF = re.compile(r"^func\s+(\w+)\s*\(", re.MULTILINE)
-
-    # func (recv) MethodName(...)
-    METHOD_DEF = re.compile(r"^func\s+\([^)]+\)\s+(\w+)\s*\(", re.MULTILINE)
-
-    # type TypeName struct/interface
-    TYPE_DEF = re.compile(r"^type\s+(\w+)\s+(struct|interface)", re.MULTILINE)
+    # One pass over the file for all three definition forms:
+    #   func FunctionName(...)
+    #   func (recv) MethodName(...)
+    #   type TypeName struct/interface
+    DEFINITION = re.compile(
+        r"^func\s+(?P<func>\w+)\s*\("
+        r"|^func\s+\([^)]+\)\s+(?P<method>\w+)\s*\("
+        r"|^type\s+(?P<type>\w+)\s+(?P<kind>struct|interface)",
+        re.MULTILINE,
+    )
 
     def can_extract(self, ctx: ExtractionContext) -> bool:
         return "func" in ctx.text or "type" in ctx.text
 
     def extract(self, ctx: ExtractionContext) -> Generator[Union[Node, Edge], None, None]:
-        filename_no_ext = ctx.file_path.stem
-
-        # 1. Functions
-        for match in self.FUNC_DEF.finditer(ctx.text):
-            func_name = match.group(1)
+        yield from self.extract_list(ctx)
+
+    def extract_list(self, ctx: ExtractionContext) -> List[Union[Node, Edge]]:
+        """Same results as `extract`, collected into a list."""
+        out: List[Union[Node, Edge]] = []
+        append = out.append
+
+        for match in self.DEFINITION.finditer(ctx.text):
+            if match["func"]:
+                name, entity_type = match["func"], "function"
+            elif match["method"]:
+                name, entity_type = match["method"], "method"
+            else:
+                # Types (Structs/Interfaces)
+                name, entity_type = match["type"], match["kind"]
             line = ctx.get_line_number(match.start())
 
-            is_exported = func_name[0].isupper()
-
-            yield ctx.create_code_entity_node(
-                name=func_name,
+            node = ctx.create_code_entity_node(
+                name=name,
                 line=line,
-                entity_type="function",
+                entity_type=entity_type,
                 language="go",
-                extra_metadata={"is_exported": is_exported},
+                extra_metadata={"is_exported": _is_exported(name)},
             )
+            append(node)
 
-            # Link file to function
-            entity_id = f"entity:{ctx.file_path}:{func_name}"
-            yield ctx.create_contains_edge(target_id=entity_id)
-
-        # 2. Methods
-        for match in self.METHOD_DEF.finditer(ctx.text):
-            method_name = match.group(1)
-            line = ctx.get_line_number(match.start())
-
-            is_exported = method_name[0].isupper()
-
-            yield ctx.create_code_entity_node(
-                name=method_name,
-                line=line,
-                entity_type="method",
-                language="go",
-                extra_metadata={"is_exported": is_exported},
-            )
-
-            entity_id = f"entity:{ctx.file_path}:{method_name}"
-            yield ctx.create_contains_edge(target_id=entity_id)
-
-        # 3. Types (Structs/Interfaces)
-        for match in self.TYPE_DEF.finditer(ctx.text):
-            type_name = match.group(1)
-            kind = match.group(2)  # struct or interface
-            line = ctx.get_line_number(match.start())
-
-            is_exported = type_name[0].isupper()
-
-            yield ctx.create_code_entity_node(
-                name=type_name,
-                line=line,
-                entity_type=kind,
-                language="go",
-                extra_metadata={"is_exported": is_exported},
-            )
+            # Link file to definition
+            append(ctx.create_contains_edge(target_id=node.id))
 
-            entity_id = f"entity:{ctx.file_path}:{type_name}"
-            yield ctx.create_contains_edge(target_id=entity_id)
+        return out
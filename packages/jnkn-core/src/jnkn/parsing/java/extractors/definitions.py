@@ -1,5 +1,5 @@
 import re
-from typing import Generator, Union
+from typing import Generator, List, Union
 
 from ....core.types import Edge, Node
 from ...base import ExtractionContext
@@ -14,16 +14,22 @@ class JavaDefinitionExtractor:
     # public class MyClass extends Parent implements Interface {
     # abstract class MyClass ...
     # interface MyInterface ...
-    CLASS_DEF = re.compile(
-        r"(?:public|protected|private|abstract|final|static|\s)*"
-        r"(class|interface|enum|record)\s+"
-        r"(\w+)"
-    )
+    #
+    # Modifiers carry nothing we capture, so the match starts at the keyword
+    # itself; `(?<!\.)` skips class literals such as `UserService.class`.
+    CLASS_DEF = re.compile(r"(?<!\.)\b(class|interface|enum|record)\s+(\w+)")
 
     def can_extract(self, ctx: ExtractionContext) -> bool:
         return "class" in ctx.text or "interface" in ctx.text
 
     def extract(self, ctx: ExtractionContext) -> Generator[Union[Node, Edge], None, None]:
+        yield from self.extract_list(ctx)
+
+    def extract_list(self, ctx: ExtractionContext) -> List[Union[Node, Edge]]:
+        """Same results as `extract`, collected into a list."""
+        out: List[Union[Node, Edge]] = []
+        append = out.append
+
         # We only care about top-level definitions usually, but regex finds all
         # To strictly map file -> class, we look for the public class that matches filename
 
@@ -35,13 +41,15 @@ class JavaDefinitionExtractor:
 
             line = ctx.get_line_number(match.start())
 
-            yield ctx.create_code_entity_node(
+            node = ctx.create_code_entity_node(
                 name=def_name,
                 line=line,
                 entity_type=def_type,
                 language="java",
                 extra_metadata={"is_public": def_name == filename_no_ext},
             )
+            append(node)
+
+            append(ctx.create_contains_edge(target_id=node.id))
 
-            entity_id = f"entity:{ctx.file_path}:{def_name}"
-            yield ctx.create_contains_edge(target_id=entity_id)
+        return out
@@ -57,12 +57,12 @@ class DefinitionExtractor:
     def _create_entity(self, ctx: ExtractionContext, name: str, pos: int, kind: str):
         line = ctx.get_line_number(pos)
 
-        yield ctx.create_code_entity_node(
+        node = ctx.create_code_entity_node(
             name=name,
             line=line,
             entity_type=kind,
             language="javascript",
         )
+        yield node
 
-        entity_id = f"entity:{ctx.file_path}:{name}"
-        yield ctx.create_contains_edge(target_id=entity_id)
+        yield ctx.create_contains_edge(target_id=node.id)
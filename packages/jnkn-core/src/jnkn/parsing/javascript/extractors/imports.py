@@ -3,10 +3,11 @@ Import Extractor for JavaScript/TypeScript.
 """
 
 import re
-from typing import Generator, Union
+from typing import Generator, List, Union
 
 from ....core.types import Edge, Node, NodeType, RelationshipType
 from ...base import ExtractionContext
+from ...multiscan import MultiPatternScanner
 
 
 class ImportExtractor:
@@ -24,32 +25,50 @@ class ImportExtractor:
 
     PATTERNS = [
         # import ... from "module"
-        (re.compile(r'import\s+.*\s+from\s+["\']([^"\']+)["\']'), "esm"),
+        (r'import\s+.*\s+from\s+["\']([^"\']+)["\']', "esm"),
         # import "module" (side-effects)
-        (re.compile(r'import\s+["\']([^"\']+)["\']'), "esm"),
+        (r'import\s+["\']([^"\']+)["\']', "esm"),
         # require("module")
-        (re.compile(r'require\s*\(\s*["\']([^"\']+)["\']\s*\)'), "commonjs"),
+        (r'require\s*\(\s*["\']([^"\']+)["\']\s*\)', "commonjs"),
         # await import("module")
-        (re.compile(r'import\s*\(\s*["\']([^"\']+)["\']\s*\)'), "dynamic"),
+        (r'import\s*\(\s*["\']([^"\']+)["\']\s*\)', "dynamic"),
         # export ... from "module"
-        (re.compile(r'export\s+.*\s+from\s+["\']([^"\']+)["\']'), "esm"),
+        (r'export\s+.*\s+from\s+["\']([^"\']+)["\']', "esm"),
+    ]
+
+    # One scan per pattern: each keeps its leading literal, which lets `re` skip
+    # ahead to candidate offsets far faster than a fused alternation can
+    IMPORT_SCANNERS = [
+        (MultiPatternScanner(re.compile(pattern), [pattern]), kind) for pattern, kind in PATTERNS
     ]
 
     def can_extract(self, ctx: ExtractionContext) -> bool:
         return "import" in ctx.text or "require" in ctx.text or "export" in ctx.text
 
     def extract(self, ctx: ExtractionContext) -> Generator[Union[Node, Edge], None, None]:
+        yield from self.extract_list(ctx)
+
+    def extract_list(self, ctx: ExtractionContext) -> List[Union[Node, Edge]]:
+        """Same results as `extract`, collected into a list."""
+        out: List[Union[Node, Edge]] = []
+
         seen_imports = set()
 
-        for regex, kind in self.PATTERNS:
-            for match in regex.finditer(ctx.text):
+        # Methods bound once, outside the per-match loop
+        append = out.append
+        seen_add = seen_imports.add
+        get_line_number = ctx.get_line_number
+        create_reads_edge = ctx.create_reads_edge
+
+        for scanner, kind in self.IMPORT_SCANNERS:
+            for match in scanner.finditer(ctx.text):
                 module_name = match.group(1)
 
                 if module_name in seen_imports:
                     continue
-                seen_imports.add(module_name)
+                seen_add(module_name)
 
-                line = ctx.get_line_number(match.start())
+                line = get_line_number(match.start())
 
                 # Resolve path
                 if module_name.startswith("."):
@@ -63,23 +82,31 @@ class ImportExtractor:
 
                 # NOTE: We do NOT use ctx.create_node here because the target node
                 # represents an external file/package, so its 'path' should NOT be the current file.
-                yield Node(
-                    id=target_id,
-                    name=module_name,
-                    type=NodeType.CODE_FILE,  # Virtual file or package
-                    path=target_path,  # Path points to the target
-                    metadata={"virtual": True, "import_type": kind, "line": line},
+                append(
+                    Node(
+                        id=target_id,
+                        name=module_name,
+                        type=NodeType.CODE_FILE,  # Virtual file or package
+                        path=target_path,  # Path points to the target
+                        metadata={"virtual": True, "import_type": kind, "line": line},
+                    )
                 )
 
-                yield ctx.create_reads_edge(
-                    target_id=target_id,
-                    line=line,
-                    pattern=kind,
+                append(
+                    create_reads_edge(
+                        target_id=target_id,
+                        line=line,
+                        pattern=kind,
+                    )
                 )
-                # Also yield classic imports edge
-                yield Edge(
-                    source_id=ctx.file_id,
-                    target_id=target_id,
-                    type=RelationshipType.IMPORTS,
-                    metadata={"kind": kind, "line": line},
+                # Also emit classic imports edge
+                append(
+                    Edge(
+                        source_id=ctx.file_id,
+                        target_id=target_id,
+                        type=RelationshipType.IMPORTS,
+                        metadata={"kind": kind, "line": line},
+                    )
                 )
+
+        return out
@@ -58,15 +58,15 @@ class NextJSExtractor:
         # Server-side data fetching functions
         if self.GET_SERVER_PROPS.search(ctx.text):
             # For standard functions, create_code_entity_node is fine
-            yield ctx.create_code_entity_node(
+            node = ctx.create_code_entity_node(
                 name="getServerSideProps",
                 line=1,
                 entity_type="server_function",
                 extra_metadata={"framework": "nextjs", "runs_on": "server"},
             )
+            yield node
 
-            func_id = f"entity:{ctx.file_path}:getServerSideProps"
-            yield ctx.create_contains_edge(target_id=func_id)
+            yield ctx.create_contains_edge(target_id=node.id)
 
         # Config file parsing
         if "next.config" in path_str:
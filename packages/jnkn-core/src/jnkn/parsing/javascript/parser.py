@@ -8,7 +8,7 @@ Includes protections against minified files which can hang the regex engine.
 
 import logging
 from pathlib import Path
-from typing import Generator, List, Union
+from typing import Any, Dict, Generator, List, Tuple, Union
 
 from ...core.types import Edge, Node, NodeType
 from ..base import (
@@ -44,6 +44,8 @@ class JavaScriptParser(LanguageParser):
         self._tree_sitter_initialized = False
         self._ts_parser = None
         self._ts_language = None
+        # (parser, language) per grammar name, built on first use
+        self._ts_grammars: Dict[str, Tuple[Any, Any]] = {}
 
     @property
     def name(self) -> str:
@@ -76,13 +78,17 @@ class JavaScriptParser(LanguageParser):
         ext = file_path.suffix.lower()
         lang_name = "typescript" if ext in (".ts", ".tsx") else "javascript"
 
-        try:
-            self._ts_parser = get_parser(lang_name)
-            self._ts_language = get_language(lang_name)
-            return True
-        except Exception as e:
-            self._logger.warning(f"Failed to initialize tree-sitter for {lang_name}: {e}")
-            return False
+        grammar = self._ts_grammars.get(lang_name)
+        if grammar is None:
+            try:
+                grammar = (get_parser(lang_name), get_language(lang_name))
+            except Exception as e:
+                self._logger.warning(f"Failed to initialize tree-sitter for {lang_name}: {e}")
+                return False
+            self._ts_grammars[lang_name] = grammar
+
+        self._ts_parser, self._ts_language = grammar
+        return True
 
     def _is_minified(self, text: str) -> bool:
         """
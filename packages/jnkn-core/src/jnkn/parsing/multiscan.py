@@ -0,0 +1,82 @@
+"""
+Multi-pattern scanning with an optional Hyperscan prefilter.
+
+Extractors that fuse several patterns into one alternation can wrap it in a
+`MultiPatternScanner`. When the `hyperscan` package is installed, the
+individual patterns are compiled into a single Hyperscan database and each
+file is first swept by its SIMD automaton:
+
+- no pattern matches anywhere: the Python regex never runs;
+- otherwise: the Python regex runs from the leftmost offset at which any
+  pattern matches, skipping the match-free prefix.
+
+Matches always come from the Python regex, so results are identical with and
+without Hyperscan. Without it, `finditer` is plain `regex.finditer`.
+"""
+
+import re
+import threading
+from typing import Iterator, Sequence
+
+try:
+    import hyperscan
+
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# Hyperscan rejects zero-width lookarounds. Dropping them only widens the
+# prefilter; the Python regex still applies them.
+_LOOKAROUND = re.compile(r"\(\?<?[=!][^()]*\)")
+
+
+def _prefilter_pattern(pattern: str) -> bytes:
+    """Translate a Python pattern into a Hyperscan expression that matches a superset."""
+    # Python's str `\s` also matches the ASCII separators \x1c-\x1f
+    return _LOOKAROUND.sub("", pattern).replace(r"\s", r"[\s\x1c-\x1f]").encode()
+
+
+class MultiPatternScanner:
+    """
+    Drop-in `finditer` for a fused regex, prefiltered by Hyperscan when available.
+
+    Args:
+        regex: The compiled Python pattern whose matches are returned.
+        patterns: The alternatives `regex` is built from. `\\s` may only
+            appear outside character classes.
+        hs_flags: Extra Hyperscan flags (e.g. `HS_FLAG_MULTILINE`) matching
+            the flags `regex` was compiled with.
+    """
+
+    def __init__(self, regex: re.Pattern, patterns: Sequence[str], hs_flags: int = 0):
+        self.regex = regex
+        self._db = None
+        self._lock = threading.Lock()
+        if HYPERSCAN_AVAILABLE:
+            try:
+                db = hyperscan.Database()
+                db.compile(
+                    expressions=[_prefilter_pattern(p) for p in patterns],
+                    ids=list(range(len(patterns))),
+                    flags=[hyperscan.HS_FLAG_SOM_LEFTMOST | hs_flags] * len(patterns),
+                )
+                self._db = db
+            except hyperscan.error:
+                # Unsupported syntax: scan with the Python regex alone
+                pass
+
+    def finditer(self, text: str) -> Iterator[re.Match]:
+        """Return the same matches as `self.regex.finditer(text)`."""
+        # Byte and character offsets only coincide for ASCII text
+        if self._db is None or not text.isascii():
+            return self.regex.finditer(text)
+
+        starts = []
+        with self._lock:
+            self._db.scan(
+                text.encode("ascii"),
+                match_event_handler=lambda _id, start, _end, _flags, _ctx: starts.append(start),
+            )
+        if not starts:
+            return iter(())
+        return self.regex.finditer(text, min(starts))
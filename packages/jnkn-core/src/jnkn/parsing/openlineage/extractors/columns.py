@@ -7,8 +7,7 @@ down to the field level.
 """
 
 import json
-import re
-from typing import Generator, List, Union
+from typing import Generator, Union
 
 from ....core.types import Edge, Node, RelationshipType
 from ...base import ExtractionContext
@@ -106,6 +105,3 @@ class ColumnExtractor:
                                         "transformations": input_field.get("transformations", []),
                                     },
                                 )
-
-    def _tokenize(self, name: str) -> List[str]:
-        return [t for t in re.split(r"[_\-./]", name.lower()) if len(t) >= 2]
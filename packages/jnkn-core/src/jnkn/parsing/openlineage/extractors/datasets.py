@@ -8,11 +8,55 @@ read/write relationships with the Job.
 
 import json
 import re
-from typing import Any, Dict, Generator, List, Union
+from typing import Any, Dict, Generator, Union
 
 from ....core.types import Edge, Node, RelationshipType
 from ...base import ExtractionContext
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def _iter_events(text: str) -> Generator[Any, None, None]:
+    """
+    Yield the events of an OpenLineage payload.
+
+    A top-level array is decoded one element at a time, so a large event log
+    never exists as a single list of dicts. Any other document is decoded whole,
+    with orjson when it is installed.
+    Decoding stops at the first malformed element.
+    """
+    pos = _WHITESPACE.match(text).end()
+    if not text.startswith("[", pos):
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        try:
+            event = orjson.loads(text) if ORJSON_AVAILABLE else json.loads(text)
+        except json.JSONDecodeError:
+            return
+        yield event
+        return
+
+    pos = _WHITESPACE.match(text, pos + 1).end()
+    if text.startswith("]", pos):
+        return
+    while True:
+        try:
+            event, pos = _DECODER.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            return
+        yield event
+        pos = _WHITESPACE.match(text, pos).end()
+        if not text.startswith(",", pos):
+            return
+        pos = _WHITESPACE.match(text, pos + 1).end()
+
 
 class DatasetExtractor:
     """
@@ -26,14 +70,9 @@ class DatasetExtractor:
         return '"inputs"' in ctx.text or '"outputs"' in ctx.text
 
     def extract(self, ctx: ExtractionContext) -> Generator[Union[Node, Edge], None, None]:
-        try:
-            data = json.loads(ctx.text)
-        except json.JSONDecodeError:
-            return
-
-        events = data if isinstance(data, list) else [data] if isinstance(data, dict) else []
-
-        for event in events:
+        for event in _iter_events(ctx.text):
+            if not isinstance(event, dict):
+                continue
             if event.get("eventType") not in ("COMPLETE", "RUNNING"):
                 continue
 
@@ -66,9 +105,7 @@ class DatasetExtractor:
         dataset_id = f"data:{namespace}/{name}"
 
         # Create Node if not seen in this context
-        if dataset_id not in ctx.seen_ids:
-            ctx.seen_ids.add(dataset_id)
-
+        if ctx.mark_seen(dataset_id):
             facets = dataset.get("facets", {})
             schema_fields = []
             if "schema" in facets:
@@ -102,6 +139,3 @@ class DatasetExtractor:
                 confidence=1.0,
                 metadata={"source": "openlineage"},
             )
-
-    def _tokenize(self, name: str) -> List[str]:
-        return [t for t in re.split(r"[_\-./]", name.lower()) if len(t) >= 2]
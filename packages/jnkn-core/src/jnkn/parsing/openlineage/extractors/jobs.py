@@ -5,11 +5,11 @@ This module handles the extraction of 'Job' entities from OpenLineage events.
 """
 
 import json
-import re
-from typing import Generator, List, Union
+from typing import Generator, Union
 
 from ....core.types import Edge, Node, NodeType
 from ...base import ExtractionContext
+from .tokens import tokenize
 
 
 class JobExtractor:
@@ -53,7 +53,7 @@ class JobExtractor:
                 id=job_id,
                 name=name,
                 type=NodeType.JOB,
-                tokens=self._tokenize(name),
+                tokens=tokenize(name),
                 metadata={
                     "namespace": namespace,
                     "source": "openlineage",
@@ -65,6 +65,3 @@ class JobExtractor:
 
             # Link file to job (File CONTAINS Job)
             yield ctx.create_contains_edge(target_id=job_id)
-
-    def _tokenize(self, name: str) -> List[str]:
-        return [t for t in re.split(r"[_\-./]", name.lower()) if len(t) >= 2]
@@ -0,0 +1,13 @@
+"""
+Name tokenization shared by the OpenLineage extractors.
+"""
+
+from typing import List
+
+# Token separators "-", "." and "/" fold into "_" so one str.split tokenizes
+_TOKEN_SEPARATORS = str.maketrans("-./", "___")
+
+
+def tokenize(name: str) -> List[str]:
+    """Split a job, dataset or column name into lowercase tokens of 2+ characters."""
+    return [t for t in name.lower().translate(_TOKEN_SEPARATORS).split("_") if len(t) >= 2]
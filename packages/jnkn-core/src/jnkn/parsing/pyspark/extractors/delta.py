@@ -1,5 +1,5 @@
 import re
-from typing import Generator, Union
+from typing import Generator, List, Union
 
 from ....core.types import Edge, Node, RelationshipType
 from ...base import ExtractionContext
@@ -15,33 +15,49 @@ class DeltaLakeExtractor:
     DELTA_FOR_PATH = re.compile(r'DeltaTable\.forPath\s*\([^,]+,\s*["\']([^"\']+)["\']')
     # DeltaTable.forName(spark, "name")
     DELTA_FOR_NAME = re.compile(r'DeltaTable\.forName\s*\([^,]+,\s*["\']([^"\']+)["\']')
-    # .mergeInto() target
-    MERGE_INTO = re.compile(r'\.merge\s*\([^,]+,\s*["\']([^"\']+)["\']\s*\)')
+    # Case-insensitive sniff; also covers "DeltaTable" without lowercasing a copy of the file
+    DELTA_SNIFF = re.compile(r"delta", re.IGNORECASE)
+
+    # (pattern, operation) pairs scanned by extract
+    PATTERNS = (
+        (DELTA_FOR_PATH, "read"),
+        (DELTA_FOR_NAME, "read"),
+    )
 
     def can_extract(self, ctx: ExtractionContext) -> bool:
-        return "delta" in ctx.text.lower() or "DeltaTable" in ctx.text
+        return self.DELTA_SNIFF.search(ctx.text) is not None
 
     def extract(self, ctx: ExtractionContext) -> Generator[Union[Node, Edge], None, None]:
-        for pattern, op in [
-            (self.DELTA_FOR_PATH, "read"),
-            (self.DELTA_FOR_NAME, "read"),
-        ]:
+        yield from self.extract_list(ctx)
+
+    def extract_list(self, ctx: ExtractionContext) -> List[Union[Node, Edge]]:
+        """Same results as `extract`, collected into a list."""
+        out: List[Union[Node, Edge]] = []
+        append = out.append
+
+        for pattern, op in self.PATTERNS:
             for match in pattern.finditer(ctx.text):
                 table_ref = match.group(1)
                 table_id = f"data:delta:{table_ref}"
                 line = ctx.get_line_number(match.start())
 
-                yield ctx.create_data_asset_node(
-                    id=table_id,
-                    name=table_ref,
-                    line=line,
-                    asset_type="delta",
-                    extra_metadata={"format": "delta"},
+                append(
+                    ctx.create_data_asset_node(
+                        id=table_id,
+                        name=table_ref,
+                        line=line,
+                        asset_type="delta",
+                        extra_metadata={"format": "delta"},
+                    )
                 )
 
                 rel_type = RelationshipType.READS if op == "read" else RelationshipType.WRITES
-                yield Edge(
-                    source_id=ctx.file_id,
-                    target_id=table_id,
-                    type=rel_type,
+                append(
+                    Edge(
+                        source_id=ctx.file_id,
+                        target_id=table_id,
+                        type=rel_type,
+                    )
                 )
+
+        return out
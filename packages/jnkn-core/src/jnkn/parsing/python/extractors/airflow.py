@@ -17,6 +17,9 @@ from ....core.types import Edge, Node
 from ...base import BaseExtractor, ExtractionContext
 from ..validation import is_valid_env_var_name
 
+# Matches Variable.get("VAR")
+VARIABLE_GET_REGEX = re.compile(r'Variable\.get\s*\(\s*["\']([^"\']+)["\']')
+
 
 class AirflowExtractor(BaseExtractor):
     """
@@ -79,11 +82,7 @@ class AirflowExtractor(BaseExtractor):
             Node: ENV_VAR nodes for each detected Airflow Variable.
             Edge: READS edges from the file to each variable.
         """
-        # Pattern matches: Variable.get(\"VAR\")
-        pattern = r'Variable\.get\s*\(\s*["\']([^"\']+)["\']'
-        regex = re.compile(pattern)
-
-        for match in regex.finditer(ctx.text):
+        for match in VARIABLE_GET_REGEX.finditer(ctx.text):
             var_name = match.group(1)
 
             if not is_valid_env_var_name(var_name):
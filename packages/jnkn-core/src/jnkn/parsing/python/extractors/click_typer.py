@@ -19,6 +19,15 @@ from ....core.types import Edge, Node
 from ...base import BaseExtractor, ExtractionContext
 from ..validation import is_valid_env_var_name
 
+# envvar parameter of a Click/Typer option, either a string or a list:
+# envvar="VAR" or envvar=["VAR1", "VAR2"]
+CLICK_ENVVAR_REGEX = re.compile(
+    r"(?:@click\.option|typer\.Option)\s*\([^)]*envvar\s*=\s*"
+    r'(\[[^\]]+\]|["\'][^"\']+["\'])',
+    re.DOTALL,
+)
+QUOTED_STRING_REGEX = re.compile(r'["\']([^"\']+)["\']')
+
 
 class ClickTyperExtractor(BaseExtractor):
     """
@@ -89,20 +98,12 @@ class ClickTyperExtractor(BaseExtractor):
             Node: ENV_VAR nodes for each detected environment variable.
             Edge: READS edges from the file to each env var.
         """
-        # Pattern matches both string and list values for envvar:
-        # envvar=\"VAR\" or envvar=[\"VAR1\", \"VAR2\"]
-        click_pattern = re.compile(
-            r"(?:@click\.option|typer\.Option)\s*\([^)]*envvar\s*=\s*"
-            r'(\[[^\]]+\]|["\'][^"\']+["\'])',
-            re.DOTALL,
-        )
-
-        for match in click_pattern.finditer(ctx.text):
+        for match in CLICK_ENVVAR_REGEX.finditer(ctx.text):
             envvar_val = match.group(1)
             line = ctx.get_line_number(match.start())
 
             # Extract all string values from the envvar parameter
-            vars_found = re.findall(r'["\']([^"\']+)["\']', envvar_val)
+            vars_found = QUOTED_STRING_REGEX.findall(envvar_val)
 
             for var_name in vars_found:
                 if not is_valid_env_var_name(var_name):
@@ -21,6 +21,9 @@ from ....core.types import Edge, Node
 from ...base import BaseExtractor, ExtractionContext
 from ..validation import is_valid_env_var_name
 
+# Matches both env("VAR") (direct call) and env.TYPE("VAR") (typed accessor)
+DJANGO_ENV_REGEX = re.compile(r'env(?:\.[a-zA-Z_]+)?\s*\(\s*["\']([^"\']+)["\']')
+
 
 class DjangoExtractor(BaseExtractor):
     """
@@ -93,13 +96,7 @@ class DjangoExtractor(BaseExtractor):
             Node: ENV_VAR nodes for each detected environment variable.
             Edge: READS edges from the file to each env var.
         """
-        # Pattern matches both:
-        # - env(\"VAR\") - direct call
-        # - env.TYPE(\"VAR\") - typed accessor
-        pattern = r'env(?:\.[a-zA-Z_]+)?\s*\(\s*["\']([^"\']+)["\']'
-        regex = re.compile(pattern)
-
-        for match in regex.finditer(ctx.text):
+        for match in DJANGO_ENV_REGEX.finditer(ctx.text):
             var_name = match.group(1)
 
             if not is_valid_env_var_name(var_name):
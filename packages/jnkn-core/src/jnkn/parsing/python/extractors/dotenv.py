@@ -12,13 +12,38 @@ python-dotenv is a popular library for loading environment variables from
 .env files, commonly used in web frameworks like Flask and Django.
 """
 
+import functools
 import re
-from typing import Generator, Union
+from typing import Generator, Tuple, Union
 
 from ....core.types import Edge, Node
 from ...base import BaseExtractor, ExtractionContext
 from ..validation import is_valid_env_var_name
 
+# Inline usage: dotenv_values()["VAR"]
+INLINE_REGEX = re.compile(r'dotenv_values\s*\([^)]*\)\s*\[\s*["\']([^"\']+)["\']')
+
+# Assignment tracking: config = dotenv_values()
+ASSIGNMENT_REGEX = re.compile(r"(\w+)\s*=\s*dotenv_values\s*\(")
+
+
+@functools.lru_cache(maxsize=256)
+def _config_access_regexes(config_vars: Tuple[str, ...]) -> Tuple[re.Pattern, re.Pattern]:
+    """
+    Compile the access patterns for a set of dotenv config variable names.
+
+    The same few names (`config`, `env`, ...) recur across files, so the
+    compiled pair is cached by the sorted name tuple.
+
+    Returns:
+        Tuple of (subscript access `config["VAR"]`, safe get `config.get("VAR")`).
+    """
+    vars_regex = "|".join(re.escape(v) for v in config_vars)
+    return (
+        re.compile(rf'(?:{vars_regex})\s*\[\s*["\']([^"\']+)["\']'),
+        re.compile(rf'(?:{vars_regex})\.get\s*\(\s*["\']([^"\']+)["\']'),
+    )
+
 
 class DotenvExtractor(BaseExtractor):
     """
@@ -80,27 +105,23 @@ class DotenvExtractor(BaseExtractor):
             Edge: READS edges from the file to each env var.
         """
         # 1. Inline usage: dotenv_values()[\"VAR\"]
-        inline_pattern = r'dotenv_values\s*\([^)]*\)\s*\[\s*["\']([^"\']+)["\']'
-        for match in re.finditer(inline_pattern, ctx.text):
+        for match in INLINE_REGEX.finditer(ctx.text):
             yield from self._yield_match(match, 1, ctx, "dotenv_values")
 
         # 2. Assignment tracking: config = dotenv_values()
-        assignment_pattern = r"(\w+)\s*=\s*dotenv_values\s*\("
         config_vars = set()
-        for match in re.finditer(assignment_pattern, ctx.text):
+        for match in ASSIGNMENT_REGEX.finditer(ctx.text):
             config_vars.add(match.group(1))
 
         if config_vars:
-            vars_regex = "|".join(re.escape(v) for v in config_vars)
+            dict_access, get_access = _config_access_regexes(tuple(sorted(config_vars)))
 
             # Dict subscript access: config[\"VAR\"]
-            dict_access_pattern = rf'(?:{vars_regex})\s*\[\s*["\']([^"\']+)["\']'
-            for match in re.finditer(dict_access_pattern, ctx.text):
+            for match in dict_access.finditer(ctx.text):
                 yield from self._yield_match(match, 1, ctx, "dotenv_values")
 
             # Safe get access: config.get(\"VAR\")
-            get_access_pattern = rf'(?:{vars_regex})\.get\s*\(\s*["\']([^"\']+)["\']'
-            for match in re.finditer(get_access_pattern, ctx.text):
+            for match in get_access.finditer(ctx.text):
                 yield from self._yield_match(match, 1, ctx, "dotenv_values")
 
     def _yield_match(
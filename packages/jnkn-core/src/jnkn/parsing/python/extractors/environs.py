@@ -21,6 +21,12 @@ from ....core.types import Edge, Node
 from ...base import BaseExtractor, ExtractionContext
 from ..validation import is_valid_env_var_name
 
+# Matches env.TYPE("VAR") where TYPE is one of the supported accessor methods
+ENVIRONS_REGEX = re.compile(
+    r"env\.(str|int|bool|float|list|dict|json|url|path|db|cache|email_url|search_url)"
+    r'\s*\(\s*["\']([^"\']+)["\']'
+)
+
 
 class EnvironsExtractor(BaseExtractor):
     """
@@ -94,15 +100,7 @@ class EnvironsExtractor(BaseExtractor):
             Node: ENV_VAR nodes for each detected environment variable.
             Edge: READS edges from the file to each env var.
         """
-        # Pattern matches: env.TYPE(\"VAR\")
-        # Where TYPE is one of the supported accessor methods
-        pattern = (
-            r"env\.(str|int|bool|float|list|dict|json|url|path|db|cache|email_url|search_url)"
-            r'\s*\(\s*["\']([^"\']+)["\']'
-        )
-        regex = re.compile(pattern)
-
-        for match in regex.finditer(ctx.text):
+        for match in ENVIRONS_REGEX.finditer(ctx.text):
             var_name = match.group(2)
 
             if not is_valid_env_var_name(var_name):
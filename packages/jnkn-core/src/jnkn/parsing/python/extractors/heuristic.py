@@ -18,6 +18,14 @@ from typing import Generator, Union
 from ....core.types import Edge, Node
 from ...base import BaseExtractor, ExtractionContext
 
+# UPPER_CASE_NAME = ... at line start, for env var-like constant names with
+# common suffixes
+ENV_LIKE_ASSIGNMENT_REGEX = re.compile(
+    r"^([A-Z][A-Z0-9_]*(?:_URL|_HOST|_PORT|_KEY|_SECRET|_TOKEN|_PASSWORD|"
+    r"_USER|_PATH|_DIR|_ENDPOINT|_URI|_DSN|_CONN))\s*=",
+    re.MULTILINE,
+)
+
 
 class HeuristicExtractor(BaseExtractor):
     """
@@ -88,14 +96,6 @@ class HeuristicExtractor(BaseExtractor):
             Node: ENV_VAR nodes for detected variables (with confidence: 0.7).
             Edge: READS edges from the file to each env var.
         """
-        # Pattern: UPPER_CASE_NAME = ... at line start
-        # Captures env var-like constant names with common suffixes
-        env_like_assignment = re.compile(
-            r"^([A-Z][A-Z0-9_]*(?:_URL|_HOST|_PORT|_KEY|_SECRET|_TOKEN|_PASSWORD|"
-            r"_USER|_PATH|_DIR|_ENDPOINT|_URI|_DSN|_CONN))\s*=",
-            re.MULTILINE,
-        )
-
         # Keywords that indicate env-related context on RHS
         env_indicators = [
             "os.getenv",
@@ -108,7 +108,7 @@ class HeuristicExtractor(BaseExtractor):
             "ENV",
         ]
 
-        for match in env_like_assignment.finditer(ctx.text):
+        for match in ENV_LIKE_ASSIGNMENT_REGEX.finditer(ctx.text):
             var_name = match.group(1)
 
             # Already seen by a more specific extractor
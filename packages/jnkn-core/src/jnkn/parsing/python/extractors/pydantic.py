@@ -19,6 +19,24 @@ from ....core.types import Edge, Node
 from ...base import BaseExtractor, ExtractionContext
 from ..validation import is_valid_env_var_name
 
+# Explicit Field(env="VAR") bindings
+FIELD_ENV_REGEX = re.compile(r'Field\s*\([^)]*env\s*=\s*["\']([^"\']+)["\']', re.DOTALL)
+
+# BaseSettings classes with their body, up to the next class or end of file
+SETTINGS_CLASS_REGEX = re.compile(
+    r"class\s+(\w+)\s*\([^)]*BaseSettings[^)]*\)\s*:\s*\n(.*?)"
+    r"(?=\nclass\s+\w+\s*[\(:]|\Z)",
+    re.DOTALL,
+)
+
+# env_prefix declared in a nested Config class
+ENV_PREFIX_REGEX = re.compile(
+    r'class\s+Config\s*:.*?env_prefix\s*=\s*["\']([^"\']*)["\']', re.DOTALL
+)
+
+# Class-level field definitions (4-space indentation): field_name: Type
+SETTINGS_FIELD_REGEX = re.compile(r"^([ \t]{4}(\w+)\s*:\s*\w+.*?)$", re.MULTILINE)
+
 
 class PydanticExtractor(BaseExtractor):
     """
@@ -98,10 +116,7 @@ class PydanticExtractor(BaseExtractor):
         self, ctx: ExtractionContext
     ) -> Generator[Union[Node, Edge], None, None]:
         """Extract explicit Field(env=\"VAR\") patterns."""
-        field_env_pattern = r'Field\s*\([^)]*env\s*=\s*["\']([^"\']+)["\']'
-        regex = re.compile(field_env_pattern, re.DOTALL)
-
-        for match in regex.finditer(ctx.text):
+        for match in FIELD_ENV_REGEX.finditer(ctx.text):
             var_name = match.group(1)
 
             if not is_valid_env_var_name(var_name):
@@ -129,32 +144,19 @@ class PydanticExtractor(BaseExtractor):
     ) -> Generator[Union[Node, Edge], None, None]:
         """Extract implicit env vars from BaseSettings class fields."""
         # Find BaseSettings classes with their body
-        class_pattern = re.compile(
-            r"class\s+(\w+)\s*\([^)]*BaseSettings[^)]*\)\s*:\s*\n(.*?)"
-            r"(?=\nclass\s+\w+\s*[\(:]|\Z)",
-            re.DOTALL,
-        )
-
-        for class_match in class_pattern.finditer(ctx.text):
+        for class_match in SETTINGS_CLASS_REGEX.finditer(ctx.text):
             class_name = class_match.group(1)
             class_body = class_match.group(2)
             class_start_line = ctx.get_line_number(class_match.start())
 
             # Check for env_prefix in Config
             prefix = ""
-            prefix_match = re.search(
-                r'class\s+Config\s*:.*?env_prefix\s*=\s*["\']([^"\']*)["\']',
-                class_body,
-                re.DOTALL,
-            )
+            prefix_match = ENV_PREFIX_REGEX.search(class_body)
             if prefix_match:
                 prefix = prefix_match.group(1)
 
             # Find field definitions: field_name: Type
-            # Uses 4-space indentation to find class-level fields
-            field_pattern = re.compile(r"^([ \t]{4}(\w+)\s*:\s*\w+.*?)$", re.MULTILINE)
-
-            for field_match in field_pattern.finditer(class_body):
+            for field_match in SETTINGS_FIELD_REGEX.finditer(class_body):
                 field_line_content = field_match.group(1)
                 field_name = field_match.group(2)
 
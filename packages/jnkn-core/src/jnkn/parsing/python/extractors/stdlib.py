@@ -15,13 +15,17 @@ are the most common and reliable.
 """
 
 import re
-from typing import Generator, Union
+from typing import Generator, List, Union
 
 from ....core.types import Edge, Node
 from ...base import BaseExtractor, ExtractionContext
+from ...multiscan import MultiPatternScanner
 from ..validation import is_valid_env_var_name
 
-# Regex patterns for stdlib environment variable access
+# Regex patterns for stdlib environment variable access. Each starts with a
+# literal so the fused regex below gets a first-character prefilter; the
+# "after from import" forms exclude the `os.` spelling with a lookbehind placed
+# after the literal rather than before it.
 ENV_VAR_PATTERNS = [
     # os.getenv("VAR") or os.getenv('VAR')
     (r'os\.getenv\s*\(\s*["\']([^"\']+)["\']', "os.getenv"),
@@ -30,13 +34,21 @@ ENV_VAR_PATTERNS = [
     # os.environ["VAR"]
     (r'os\.environ\s*\[\s*["\']([^"\']+)["\']', "os.environ[]"),
     # environ.get("VAR") - after from import
-    (r'(?<!os\.)environ\.get\s*\(\s*["\']([^"\']+)["\']', "environ.get"),
+    (r'environ(?<!os\.environ)\.get\s*\(\s*["\']([^"\']+)["\']', "environ.get"),
     # environ["VAR"] - after from import
-    (r'(?<!os\.)environ\s*\[\s*["\']([^"\']+)["\']', "environ[]"),
+    (r'environ(?<!os\.environ)\s*\[\s*["\']([^"\']+)["\']', "environ[]"),
     # getenv("VAR") - after from import
-    (r'(?<!os\.)getenv\s*\(\s*["\']([^"\']+)["\']', "getenv"),
+    (r'getenv(?<!os\.getenv)\s*\(\s*["\']([^"\']+)["\']', "getenv"),
 ]
 
+# All patterns fused into one alternation so a file is scanned once. Each
+# pattern has exactly one group, so the matched group's index identifies the
+# pattern. Wrapping the alternatives in groups of their own would hide their
+# leading literals from the prefilter.
+ENV_VAR_REGEX = re.compile("|".join(pattern for pattern, _ in ENV_VAR_PATTERNS))
+_PATTERN_NAMES = {i + 1: name for i, (_, name) in enumerate(ENV_VAR_PATTERNS)}
+ENV_VAR_SCANNER = MultiPatternScanner(ENV_VAR_REGEX, [pattern for pattern, _ in ENV_VAR_PATTERNS])
+
 
 class StdlibExtractor(BaseExtractor):
     """
@@ -84,7 +96,8 @@ class StdlibExtractor(BaseExtractor):
         Returns:
             bool: True if the text contains stdlib env patterns.
         """
-        return "os." in ctx.text or "environ" in ctx.text or "getenv" in ctx.text
+        # Every pattern contains one of these; a bare "os." is not enough
+        return "environ" in ctx.text or "getenv" in ctx.text
 
     def extract(self, ctx: ExtractionContext) -> Generator[Union[Node, Edge], None, None]:
         """
@@ -101,33 +114,49 @@ class StdlibExtractor(BaseExtractor):
             Node: ENV_VAR nodes for each detected environment variable.
             Edge: READS edges from the file to each env var.
         """
-        for pattern, pattern_name in ENV_VAR_PATTERNS:
-            regex = re.compile(pattern)
-
-            for match in regex.finditer(ctx.text):
-                var_name = match.group(1)
-
-                # Validate the variable name
-                if not is_valid_env_var_name(var_name):
-                    continue
-
-                # Deduplicate using context's seen_ids
-                if not ctx.mark_seen(var_name):
-                    continue
-
-                line = ctx.get_line_number(match.start())
-
-                # Use the context factory to create the node
-                # This ensures `path` is always set correctly
-                yield ctx.create_env_var_node(
-                    name=var_name,
-                    line=line,
-                    source=pattern_name,
-                )
-
-                # Create the READS edge from file to env var
-                yield ctx.create_reads_edge(
-                    target_id=f"env:{var_name}",
-                    line=line,
-                    pattern=pattern_name,
-                )
+        yield from self.extract_list(ctx)
+
+    def extract_list(self, ctx: ExtractionContext) -> List[Union[Node, Edge]]:
+        """
+        Extract environment variable nodes and edges into a list.
+
+        Same results as `extract`, built with appends instead of generator
+        resumes; `ExtractorRegistry` prefers this method when present.
+
+        Args:
+            ctx: The extraction context containing file info and text.
+
+        Returns:
+            List[Union[Node, Edge]]: ENV_VAR nodes and their READS edges.
+        """
+        out: List[Union[Node, Edge]] = []
+
+        # Methods bound once, outside the per-match loop
+        append = out.append
+        mark_seen = ctx.mark_seen
+        get_line_number = ctx.get_line_number
+        create_env_var_node = ctx.create_env_var_node
+        create_reads_edge = ctx.create_reads_edge
+
+        for match in ENV_VAR_SCANNER.finditer(ctx.text):
+            pattern_name = _PATTERN_NAMES[match.lastindex]
+            var_name = match.group(match.lastindex)
+
+            # Validate the variable name
+            if not is_valid_env_var_name(var_name):
+                continue
+
+            # Deduplicate using context's seen_ids
+            if not mark_seen(var_name):
+                continue
+
+            line = get_line_number(match.start())
+
+            # Use the context factory to create the node
+            # This ensures `path` is always set correctly
+            append(create_env_var_node(name=var_name, line=line, source=pattern_name))
+
+            # Create the READS edge from file to env var
+            append(create_reads_edge(target_id=f"env:{var_name}", line=line, pattern=pattern_name))
+
+        return out
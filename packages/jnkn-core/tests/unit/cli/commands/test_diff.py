@@ -0,0 +1,38 @@
+"""
+Unit tests for the 'diff' command.
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner
+
+from jnkn.cli.commands.diff import diff
+
+
+@patch("jnkn.cli.commands.diff.ReviewerSuggester")
+@patch("jnkn.cli.commands.diff.RiskAnalyzer")
+@patch("jnkn.cli.commands.diff.DiffAnalyzer")
+@patch("jnkn.cli.commands.diff._build_virtual_base_graph")
+@patch("jnkn.cli.commands.diff.SQLiteStorage")
+@patch("jnkn.cli.commands.diff.create_default_engine")
+@patch("jnkn.cli.commands.diff.GitDiffEngine")
+def test_diff_json_escapes_non_ascii_paths(
+    mock_git, mock_engine, mock_storage, mock_base, mock_diff, mock_risk, mock_reviewers
+):
+    """JSON output stays ASCII, so a non-UTF-8 console can print it."""
+    mock_git.return_value.get_changed_files.return_value = [MagicMock()]
+    report = mock_diff.return_value.compare.return_value
+    report.to_dict.return_value = {"changed_files": ["src/café.py"]}
+    report.get_affected_paths.return_value = []
+    mock_risk.return_value.analyze.return_value.to_dict.return_value = {"level": "LOW"}
+    mock_reviewers.return_value.suggest.return_value = []
+
+    runner = CliRunner(charset="ascii")
+    with runner.isolated_filesystem():
+        result = runner.invoke(diff, ["main", "HEAD", "--format", "json"])
+
+    assert result.exit_code == 0, result.output
+    assert "caf\\u00e9.py" in result.output
+    document = result.output[result.output.index("{") :]
+    assert json.loads(document)["changes"] == {"changed_files": ["src/café.py"]}
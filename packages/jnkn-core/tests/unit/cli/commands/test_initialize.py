@@ -8,6 +8,7 @@ Covers:
 - Telemetry configuration
 """
 
+import copy
 import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -16,7 +17,13 @@ import pytest
 import yaml
 from click.testing import CliRunner
 
-from jnkn.cli.commands.initialize import create_gitignore, detect_stack, init
+from jnkn.cli.commands.initialize import (
+    DEFAULT_CONFIG,
+    _new_config,
+    create_gitignore,
+    detect_stack,
+    init,
+)
 
 
 class TestStackDetection:
@@ -50,6 +57,26 @@ class TestStackDetection:
     def test_detects_nothing(self, tmp_path):
         assert detect_stack(tmp_path) == set()
 
+    def test_ignores_directory_named_like_marker_file(self, tmp_path):
+        (tmp_path / "package.json").mkdir()
+        assert detect_stack(tmp_path) == set()
+
+    def test_detects_nested_files(self, tmp_path):
+        (tmp_path / "infra" / "modules").mkdir(parents=True)
+        (tmp_path / "infra" / "modules" / "main.tf").touch()
+        (tmp_path / "k8s").mkdir()
+        (tmp_path / "k8s" / "deploy.yml").touch()
+        assert detect_stack(tmp_path) == {"terraform", "kubernetes"}
+
+    def test_ignores_excluded_directories(self, tmp_path):
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "build.py").touch()
+        (tmp_path / "venv").mkdir()
+        (tmp_path / "venv" / "config.yaml").touch()
+        # Extensionless names do not count as a match
+        (tmp_path / "py").touch()
+        assert detect_stack(tmp_path) == set()
+
 
 class TestGitIgnore:
     """Unit tests for create_gitignore helper."""
@@ -92,6 +119,17 @@ class TestGitIgnore:
         # Should not duplicate
         assert gitignore.read_text() == initial_content
 
+    def test_appends_to_non_utf8_gitignore(self, tmp_path):
+        gitignore = tmp_path / ".gitignore"
+        gitignore.write_bytes(b"caf\xe9/\n")
+
+        jnkn_dir = tmp_path / ".jnkn"
+        jnkn_dir.mkdir()
+
+        create_gitignore(jnkn_dir)
+
+        assert b".jnkn/" in gitignore.read_bytes()
+
 
 class TestInitCommand:
     """Integration tests for the standard init command."""
@@ -195,6 +233,29 @@ class TestInitCommand:
                 
             assert config["scan"]["include"] == ["**/*"]
 
+    @patch("jnkn.cli.commands.initialize.detect_stack")
+    @patch("jnkn.cli.commands.initialize.Confirm.ask")
+    def test_init_leaves_default_config_untouched(self, mock_confirm, mock_detect, runner):
+        """Test that building a config does not mutate the module-level template."""
+        mock_detect.return_value = {"python"}
+        mock_confirm.return_value = True
+        expected = copy.deepcopy(DEFAULT_CONFIG)
+
+        with runner.isolated_filesystem():
+            runner.invoke(init)
+
+        assert DEFAULT_CONFIG == expected
+
+    def test_new_config_returns_independent_copies(self):
+        """Test that each fresh config has its own nested containers."""
+        first, second = _new_config(), _new_config()
+        assert first == second == DEFAULT_CONFIG
+
+        first["scan"]["include"].append("**/*.py")
+        first["telemetry"]["enabled"] = True
+        assert second["scan"]["include"] == []
+        assert second["telemetry"]["enabled"] is False
+
 
 class TestInitDemo:
     """Integration tests for the 'init --demo' command flow."""
@@ -15,6 +15,7 @@ from watchdog.events import FileModifiedEvent, FileDeletedEvent
 
 from jnkn.cli.commands.watch import watch
 from jnkn.cli.watcher import ParsingEventHandler, FileSystemWatcher
+from jnkn.core.types import ScanMetadata
 from jnkn.parsing.base import ParseResult
 
 
@@ -70,6 +71,25 @@ class TestParsingEventHandler:
         # Ensure stitching was triggered
         stitcher.stitch.assert_called()
 
+    def test_on_modified_skips_unchanged_content(self, mock_components, tmp_path):
+        """Test that a modify event without a content change does not re-parse."""
+        engine, storage, config, stitcher = mock_components
+        config.should_skip_dir.return_value = False
+        config.should_skip_file.return_value = False
+
+        app = tmp_path / "app.py"
+        app.write_text("import os\n")
+        storage.get_scan_metadata.return_value = ScanMetadata(
+            file_path=str(app), file_hash=ScanMetadata.compute_hash(str(app))
+        )
+
+        handler = ParsingEventHandler(engine, storage, config, stitcher, tmp_path)
+        handler.on_modified(FileModifiedEvent(str(app)))
+
+        engine._parse_file_full.assert_not_called()
+        storage.delete_nodes_by_file.assert_not_called()
+        stitcher.stitch.assert_not_called()
+
     def test_on_modified_skips_ignored_files(self, mock_components):
         """Test that ignored files do not trigger parsing."""
         engine, storage, config, stitcher = mock_components
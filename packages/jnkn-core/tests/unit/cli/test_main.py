@@ -0,0 +1,27 @@
+"""
+Unit tests for command registration on the main CLI group.
+"""
+
+from click.testing import CliRunner
+
+from jnkn.cli.main import HIDDEN_COMMANDS, main
+
+
+def test_help_lists_only_public_commands():
+    """Hidden commands stay out of `jnkn --help`."""
+    result = CliRunner().invoke(main, ["--help"])
+
+    assert result.exit_code == 0
+    assert "check" in result.output
+    assert "blast" not in result.output
+
+
+def test_hidden_commands_resolve_on_demand():
+    """Every hidden command loads by name and is registered hidden."""
+    ctx = main.make_context("jnkn", [], resilient_parsing=True)
+
+    for name in HIDDEN_COMMANDS:
+        command = main.get_command(ctx, name)
+        assert command is not None, name
+        assert command.hidden
+    assert main.get_command(ctx, "no-such-command") is None
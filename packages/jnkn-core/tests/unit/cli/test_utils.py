@@ -9,6 +9,14 @@ import pytest
 from jnkn.cli.utils import load_graph, echo_low_node_warning
 
 
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep the JSON graph cache out of the real home directory."""
+    cache_dir = tmp_path / "graph-cache"
+    monkeypatch.setattr("jnkn.cli.utils.GRAPH_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
 class TestUtils:
     """Tests for shared CLI utility functions."""
 
@@ -52,4 +60,53 @@ class TestUtils:
         captured = capsys.readouterr()
         
         assert "Low node count detected!" in captured.out
-        assert "(3 nodes found)" in captured.out
\ No newline at end of file
+        assert "(3 nodes found)" in captured.out
+
+
+class TestJsonGraphCache:
+    """Tests for the pickled JSON graph cache behind load_graph."""
+
+    def test_second_load_hits_cache(self, tmp_path, cache_dir):
+        """An unchanged file is served from the pickle without re-parsing JSON."""
+        f = tmp_path / "graph.json"
+        f.write_text(json.dumps({"nodes": [{"id": "env:A"}], "edges": []}))
+
+        assert load_graph(str(f)).has_node("env:A")
+        assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+        with patch("jnkn.cli.utils.json.loads") as mock_loads:
+            assert load_graph(str(f)).has_node("env:A")
+            mock_loads.assert_not_called()
+
+    def test_changed_file_replaces_entry(self, tmp_path, cache_dir):
+        """Rewriting the file invalidates its cached graph."""
+        f = tmp_path / "graph.json"
+        f.write_text(json.dumps({"nodes": [{"id": "env:A"}], "edges": []}))
+        load_graph(str(f))
+
+        f.write_text(json.dumps({"nodes": [{"id": "env:BB"}], "edges": []}))
+        graph = load_graph(str(f))
+
+        assert graph.has_node("env:BB") and not graph.has_node("env:A")
+        assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+    def test_cache_is_capped(self, tmp_path, cache_dir, monkeypatch):
+        """Only the most recently written entries are kept."""
+        monkeypatch.setattr("jnkn.cli.utils.GRAPH_CACHE_MAX_ENTRIES", 2)
+        for name in ("a", "b", "c"):
+            f = tmp_path / f"{name}.json"
+            f.write_text(json.dumps({"nodes": [{"id": f"env:{name}"}], "edges": []}))
+            load_graph(str(f))
+
+        assert len(list(cache_dir.glob("*.pkl"))) == 2
+
+    def test_format_is_part_of_key(self, tmp_path, cache_dir, monkeypatch):
+        """Bumping the cache format ignores pickles written under the old one."""
+        f = tmp_path / "graph.json"
+        f.write_text(json.dumps({"nodes": [{"id": "env:A"}], "edges": []}))
+        load_graph(str(f))
+
+        monkeypatch.setattr("jnkn.cli.utils.GRAPH_CACHE_FORMAT", 2)
+        with patch("jnkn.cli.utils.json.loads", wraps=json.loads) as mock_loads:
+            load_graph(str(f))
+            mock_loads.assert_called_once()
@@ -74,6 +74,20 @@ def test_traversal(graph, sample_nodes):
     assert len(anc_c) == 2
 
 
+def test_impacted_nodes_covering_whole_graph(graph, sample_nodes):
+    a, b, c = sample_nodes
+    for node in sample_nodes:
+        graph.add_node(node)
+
+    # a provides b; c reads b, so a change to b reaches c
+    graph.add_edge(Edge(source_id=a.id, target_id=b.id, type=RelationshipType.PROVIDES))
+    graph.add_edge(Edge(source_id=c.id, target_id=b.id, type=RelationshipType.READS))
+
+    # Unknown sources do not count toward the visited total
+    assert graph.get_impacted_nodes([a.id, "missing"]) == {b.id, c.id}
+    assert graph.get_impacted_nodes([a.id], max_depth=1) == {b.id}
+
+
 def test_token_indexing(graph, sample_nodes):
     a, b, c = sample_nodes
     graph.add_node(a) # tokens: service, a
@@ -111,4 +125,37 @@ def test_remove_node(graph, sample_nodes):
     assert not graph.has_node(a.id)
     assert graph.has_node(b.id)
     # Edge should be gone (implicitly in rustworkx, explicitly tracked in counts usually)
-    assert graph.edge_count == 0
\ No newline at end of file
+    assert graph.edge_count == 0
+
+
+def test_batch_add_matches_single_add(sample_nodes):
+    a, b, c = sample_nodes
+    renamed_a = a.model_copy(update={"name": "Renamed A", "tokens": ["renamed"]})
+    nodes = [a, b, renamed_a, c]
+    edges = [
+        Edge(source_id=a.id, target_id=b.id, type=RelationshipType.READS),
+        Edge(source_id=a.id, target_id=b.id, type=RelationshipType.READS),
+        Edge(source_id=a.id, target_id=b.id, type=RelationshipType.PROVIDES),
+        Edge(source_id=b.id, target_id=c.id, type=RelationshipType.READS),
+        Edge(source_id=b.id, target_id="missing", type=RelationshipType.READS),
+    ]
+
+    single = DependencyGraph()
+    for node in nodes:
+        single.add_node(node)
+    for edge in edges:
+        single.add_edge(edge)
+
+    batch = DependencyGraph()
+    batch.add_nodes(nodes[:2])
+    batch.add_nodes(nodes[2:])
+    batch.add_edges(edges[:1])
+    batch.add_edges(edges[1:])
+
+    assert batch.node_count == single.node_count == 3
+    assert batch.edge_count == single.edge_count == 3
+    assert batch.get_node(a.id).name == "Renamed A"
+    assert batch.find_nodes_by_tokens(["renamed"]) == [batch.get_node(a.id)]
+    assert batch.find_nodes_by_tokens(["service"]) == []
+    assert list(batch.iter_nodes()) == list(single.iter_nodes())
+    assert list(batch.iter_edges()) == list(single.iter_edges())
@@ -2,10 +2,14 @@
 Unit tests for the visualization module (Smoke Tests).
 """
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 import pytest
+import base64
+import gzip
 import json
 from jnkn.core.types import Node, Edge, NodeType, RelationshipType
+from jnkn.graph import visualizer
+from jnkn.graph.visualizer import builder
 from jnkn.graph.visualizer import generate_html
 
 class TestVisualize:
@@ -42,15 +46,15 @@ class TestVisualize:
         """
         Smoke Test: Ensure HTML is generated, assets are embedded, and data is injected.
         """
-        html = generate_html(mock_graph)
+        html = generate_html(mock_graph).decode("utf-8")
         
         # 1. Structure Check
         assert "<!DOCTYPE html>" in html
         assert "<title>Jnkn Impact Cockpit</title>" in html
         
         # 2. Data Injection Check
-        assert "const rawData =" in html
-        assert 'id": "env:DB_HOST"' in html
+        assert '<script type="application/json" id="graph-data">' in html
+        assert '"env:DB_HOST"' in html
         
         # 3. Design System Check (Mission Control Theme)
         # Verify specific CSS variables from the new theme
@@ -61,4 +65,111 @@ class TestVisualize:
         # 4. JS Application Logic Check
         assert "const AppState =" in html
         assert "const DataProcessor =" in html
-        assert "const DOMBuilders =" in html
\ No newline at end of file
+        assert "const DOMBuilders =" in html
+
+    def test_generate_html_compressed_roundtrip(self, mock_graph):
+        """Compressed output must decompress to the exact uncompressed document."""
+        compressed = generate_html(mock_graph, compress=True)
+
+        assert gzip.decompress(compressed) == generate_html(mock_graph)
+
+    def test_generate_html_from_to_dict_only(self, mock_graph):
+        """Objects exposing only to_dict embed the same graph data as streamed IGraphs."""
+        graph = MagicMock(spec=["to_dict"])
+        graph.to_dict.return_value = mock_graph.to_dict.return_value
+
+        streamed = json.loads(visualizer._graph_json(mock_graph).tobytes())
+        assert json.loads(visualizer._graph_json(graph).tobytes()) == streamed
+        assert len(streamed["nodes"]) == 3
+        assert len(streamed["edges"]) == 2
+
+    def test_generate_html_reuses_cached_document(self, mock_graph):
+        """Identical graph payloads return the cached document without rebuilding."""
+        visualizer._HTML_CACHE.clear()
+        first = generate_html(mock_graph)
+
+        assert generate_html(mock_graph) is first
+        assert len(visualizer._HTML_CACHE) == 1
+
+    def test_write_file_truncates_existing(self, tmp_path):
+        """Raw fd writes replace any previous file contents."""
+        target = tmp_path / "graph.html"
+        target.write_bytes(b"x" * 100)
+
+        visualizer._write_file(str(target), b"<html></html>")
+
+        assert target.read_bytes() == b"<html></html>"
+
+    def test_open_visualization_without_browser(self, mock_graph, tmp_path):
+        """open_browser=False writes the file and never touches webbrowser."""
+        target = tmp_path / "graph.html"
+
+        with patch("webbrowser.open") as mock_open:
+            path = visualizer.open_visualization(mock_graph, str(target), open_browser=False)
+
+        mock_open.assert_not_called()
+        assert path == str(target)
+        assert target.read_bytes() == generate_html(mock_graph)
+
+    def test_minify_css_preserves_selector_whitespace(self):
+        """Comments go, but a descendant pseudo-class selector keeps its space."""
+        css = b"/* theme */\n.a :hover {\n    color: red;\n}\n"
+
+        assert builder._minify_css(css) == b".a :hover{color:red}"
+
+    def test_json_default_dispatch(self):
+        """Known types are converted; anything else keeps the TypeError contract."""
+        node = Node(id="env:X", name="X", type=NodeType.ENV_VAR)
+
+        assert visualizer._json_default(node)["id"] == "env:X"
+        assert visualizer._json_default(node.created_at) == node.created_at.isoformat()
+        with pytest.raises(TypeError):
+            visualizer._json_default(object())
+
+    def test_generate_html_binary_endpoints(self, mock_graph):
+        """Binary mode drops edge endpoints from JSON and packs them as varints."""
+        data = json.loads(visualizer._graph_binary(mock_graph))
+        raw = base64.b64decode(data["endpoints"])
+
+        values, shift, value = [], 0, 0
+        for byte in raw:
+            value |= (byte & 0x7F) << shift
+            shift += 7
+            if not byte & 0x80:
+                values.append(value)
+                value, shift = 0, 0
+
+        ids = [n["id"] for n in data["nodes"]] + data["extra_ids"]
+        source, pairs = 0, []
+        for delta, target in zip(values[::2], values[1::2]):
+            source += delta
+            pairs.append((ids[source], ids[target]))
+
+        assert "source_id" not in data["edges"][0]
+        assert sorted(pairs) == sorted(
+            (e.source_id, e.target_id) for e in mock_graph.iter_edges.return_value
+        )
+        assert b'"endpoints":"' in generate_html(mock_graph, binary=True)
+
+    def test_build_html_escapes_script_close(self):
+        """Payload strings cannot terminate the embedding script element."""
+        payload = json.dumps({"nodes": [{"id": "</script><b>"}], "edges": []}).encode()
+        html = builder.build_html(payload)
+
+        embedded = html.partition(b'id="graph-data">')[2].partition(b"</script>")[0]
+        assert json.loads(embedded) == json.loads(payload)
+        assert builder.build_html(memoryview(b'{"nodes":[]}')).count(b'{"nodes":[]}') == 1
+
+    def test_open_visualization_background(self, mock_graph, tmp_path):
+        """background=True returns the path and writes the file off-thread."""
+        target = tmp_path / "graph.html"
+
+        with patch("threading.Thread") as mock_thread:
+            path = visualizer.open_visualization(
+                mock_graph, str(target), open_browser=False, background=True
+            )
+
+        assert path == str(target)
+        kwargs = mock_thread.call_args.kwargs
+        kwargs["target"](*kwargs["args"])
+        assert target.read_bytes() == generate_html(mock_graph)
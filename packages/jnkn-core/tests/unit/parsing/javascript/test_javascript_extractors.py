@@ -8,6 +8,7 @@ import pytest
 
 from jnkn.core.types import Node, Edge, NodeType, RelationshipType
 from jnkn.parsing.base import ExtractionContext
+from jnkn.parsing.javascript.extractors.imports import ImportExtractor
 from jnkn.parsing.javascript.extractors.nextjs import NextJSExtractor
 from jnkn.parsing.javascript.extractors.package_json import PackageJsonExtractor
 
@@ -93,4 +94,15 @@ class TestPackageJsonExtractor:
         assert start_job.metadata["command"] == "next start"
         
         # Verify edges
-        assert len(edges) == 4 # 2 deps + 2 scripts
\ No newline at end of file
+        assert len(edges) == 4 # 2 deps + 2 scripts
+
+class TestImportExtractor:
+    def test_single_line_statements(self):
+        """A long `import ... from` match does not hide later statements on the line."""
+        text = 'import a from "./a"; const z = require("zod"); import "./side"; const m = await import("./m")'
+        ctx = ExtractionContext(file_path=Path("src/index.js"), file_id="file://src/index.js", text=text)
+
+        results = list(ImportExtractor().extract(ctx))
+
+        kinds = {r.name: r.metadata["import_type"] for r in results if isinstance(r, Node)}
+        assert kinds == {"./a": "esm", "zod": "commonjs", "./side": "esm", "./m": "dynamic"}
@@ -0,0 +1,28 @@
+"""
+Unit tests for the JavaScript/TypeScript parser.
+"""
+
+from pathlib import Path
+
+from jnkn.parsing.javascript import parser as js_parser
+from jnkn.parsing.javascript.parser import JavaScriptParser
+
+
+def test_tree_sitter_grammar_created_once_per_language(monkeypatch):
+    created = []
+
+    def fake_get_parser(name):
+        created.append(name)
+        return f"parser:{name}"
+
+    monkeypatch.setattr(js_parser, "TREE_SITTER_AVAILABLE", True)
+    monkeypatch.setattr(js_parser, "get_parser", fake_get_parser, raising=False)
+    monkeypatch.setattr(js_parser, "get_language", lambda name: f"lang:{name}", raising=False)
+
+    parser = JavaScriptParser()
+    for name in ("a.js", "b.ts", "c.jsx", "d.tsx"):
+        assert parser._init_tree_sitter(Path(name))
+
+    assert created == ["javascript", "typescript"]
+    assert parser._ts_parser == "parser:typescript"
+    assert parser._ts_language == "lang:typescript"
@@ -14,6 +14,7 @@ from jnkn.parsing.base import ExtractionContext
 from jnkn.parsing.openlineage.extractors.jobs import JobExtractor
 from jnkn.parsing.openlineage.extractors.datasets import DatasetExtractor
 from jnkn.parsing.openlineage.extractors.columns import ColumnExtractor
+from jnkn.parsing.openlineage.extractors.tokens import tokenize
 
 @pytest.fixture
 def make_context():
@@ -47,6 +48,7 @@ class TestJobExtractor:
         assert node.id == "job:spark/daily_etl"
         assert node.type == NodeType.JOB
         assert node.metadata["run_id"] == "123"
+        assert node.tokens == ["daily", "etl"]
         
         edge = next(r for r in results if isinstance(r, Edge))
         assert edge.target_id == "job:spark/daily_etl"
@@ -93,6 +95,27 @@ class TestDatasetExtractor:
         assert write_edge.source_id == "job:ns/job1"
         assert write_edge.target_id == "data:s3/bucket/data"
 
+    def test_extract_event_array(self, make_context):
+        """Events in a top-level array are decoded one by one; non-final events are skipped."""
+        events = [
+            {"eventType": "START", "job": {"name": "job1"}, "inputs": [{"name": "skipped"}]},
+            {"eventType": "COMPLETE", "job": {"name": "job1"}, "inputs": [{"name": "a"}]},
+            {"eventType": "RUNNING", "job": {"name": "job2"}, "outputs": [{"name": "b"}]},
+        ]
+        results = list(DatasetExtractor().extract(make_context(events)))
+
+        edges = {(e.source_id, e.target_id) for e in results if isinstance(e, Edge)}
+        assert edges == {("job:default/job1", "data:default/a"), ("job:default/job2", "data:default/b")}
+
+class TestTokenize:
+    """Tests for the tokenizer shared by the OpenLineage extractors."""
+
+    def test_splits_on_separators(self):
+        assert tokenize("Spark.jobs/etl-daily_run") == ["spark", "jobs", "etl", "daily", "run"]
+
+    def test_drops_short_tokens(self):
+        assert tokenize("a_b.cd") == ["cd"]
+
 class TestColumnExtractor:
     """Tests for the ColumnExtractor."""
 
@@ -0,0 +1,30 @@
+"""
+Unit tests for the multi-pattern scanner.
+"""
+
+import re
+
+import pytest
+
+from jnkn.parsing.multiscan import MultiPatternScanner
+
+PATTERNS = [r'(?<!os\.)getenv\s*\(\s*"(\w+)"', r'os\.environ\[\s*"(\w+)"']
+REGEX = re.compile("|".join(f"({p})" for p in PATTERNS))
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "x = 1\n" * 50,
+        'a = os.getenv("SKIPPED")\nb = getenv("KEPT")\nc = os.environ["ALSO"]\n',
+        'd = getenv(\x1c"SEPARATOR")\n',
+        'name = "é"\nd = getenv("UNICODE")\n',
+    ],
+)
+def test_scanner_matches_regex(text):
+    """Results are identical to the underlying regex, whichever backend runs."""
+    scanner = MultiPatternScanner(REGEX, PATTERNS)
+
+    expected = [(m.span(), m.groups()) for m in REGEX.finditer(text)]
+    assert [(m.span(), m.groups()) for m in scanner.finditer(text)] == expected
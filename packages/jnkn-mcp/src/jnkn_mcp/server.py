@@ -18,6 +18,13 @@ from typing import Any, Dict, List, Optional
 from fastmcp import FastMCP
 from pydantic import BaseModel, Field
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from jnkn.analysis.blast_radius import BlastRadiusAnalyzer
 from jnkn.core.graph import DependencyGraph
 from jnkn.core.storage.sqlite import SQLiteStorage
@@ -27,9 +34,30 @@ from jnkn.core.types import NodeType
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("jnkn-mcp")
 
+
+def _json_default(obj: Any) -> Any:
+    """orjson fallback for tool results that are (or contain) Pydantic models."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+
+def _serialize_tool_result(data: Any) -> str:
+    """Serialize tool results to JSON text with orjson."""
+    return orjson.dumps(
+        data,
+        default=_json_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    ).decode("utf-8")
+
+
 # Initialize MCP Server
 # Removed 'description' arg which caused TypeError in older fastmcp versions
-mcp = FastMCP("Jnkn Context Service")
+# Without orjson, FastMCP's default (pydantic-based) serializer is used.
+mcp = FastMCP(
+    "Jnkn Context Service",
+    tool_serializer=_serialize_tool_result if ORJSON_AVAILABLE else None,
+)
 
 
 class GraphManager: